@@ -1,7 +1,10 @@
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional
-from uuid import uuid4
+from src.core.id_source import IdSource
+
+
+_next_claim_id = IdSource("c").next_id
 
 
 class ClaimLabel(Enum):
@@ -23,7 +26,7 @@ class ClaimLabel(Enum):
     SPECULATIVE = "SPECULATIVE"
 
 
-@dataclass
+@dataclass(slots=True)
 class Claim:
     claim_id: str
     statement: str
@@ -40,7 +43,8 @@ class Claim:
         if self.claim_label is None:
             raise ValueError("Claim label is required (GC-2)")
         
-        if not isinstance(self.claim_label, ClaimLabel):
+        # Enums with members cannot be subclassed, so identity matches isinstance
+        if type(self.claim_label) is not ClaimLabel:
             raise TypeError(
                 f"Claim label must be ClaimLabel enum, got {type(self.claim_label).__name__}"
             )
@@ -60,7 +64,7 @@ class Claim:
         claim_span: Optional[tuple[int, int]] = None,
     ) -> "Claim":
         return Claim(
-            claim_id=str(uuid4()),
+            claim_id=_next_claim_id(),
             statement=statement,
             claim_label=claim_label,
             step_id=step_id,
@@ -69,12 +73,12 @@ class Claim:
         )
 
     def is_supported(self) -> bool:
-        if self.claim_label == ClaimLabel.SPECULATIVE:
+        if self.claim_label is ClaimLabel.SPECULATIVE:
             return True
         return len(self.evidence_ids) > 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ClaimDraft:
     statement: str
     claim_span: Optional[tuple[int, int]] = None
@@ -1,5 +1,10 @@
+import os
 import re
-from typing import Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import chain
+from typing import Iterator, Optional
 from src.core.claim import ClaimDraft, ClaimLabel
 
 
@@ -21,6 +26,12 @@ class ClaimExtractor:
         "evident",
     ]
     
+    DERIVED_CUES = ("therefore", "thus", "hence", "implies", "follows", "derive")
+    COMPUTED_CUES = ("compute", "calculate", "evaluate", "numerical", "simulate")
+    CITED_CUES = (
+        "theorem", "lemma", "proposition", "according to", "from ref", "cite", "citation",
+    )
+    
     DEFINITION_MARKERS = [
         "let",
         "define",
@@ -40,12 +51,44 @@ class ClaimExtractor:
         r'\$[^$]+\$',
     ]
 
+    _ASSERTION_RE = re.compile(
+        r'\b(is|are|equals?|becomes?|satisfies?|obeys?|follows?|implies?|yields?|gives?'
+        r'|therefore|thus|hence|so|to be|theorem|lemma|proposition|corollary)\b'
+        r'|[=<>≤≥≠≈∝]',
+        re.IGNORECASE,
+    )
+    _SENT_RE = re.compile(r'[.!?]\s+(?=[A-Z])')
+    # Conjunction split is case-sensitive; ', and ' is covered by ' and '.
+    _CONJ_RE = re.compile(r' (?:and|while|whereas) ')
+    _ACCORDING_TO_RE = re.compile(r'according to', re.IGNORECASE)
+    _RELATION_RE = re.compile(r'[=<>≤≥≠≈∝]')
+    _DEF_PREFIX_RE = re.compile(
+        r'\s*(?:' + '|'.join(re.escape(m) for m in DEFINITION_MARKERS) + r') ',
+        re.IGNORECASE,
+    )
+    _DEF_BE_RE = re.compile(r'\b(be|equal|denote)\b', re.IGNORECASE)
+    _DEF_THEN_RE = re.compile(r'\b(then|thus|therefore|hence|so)\b', re.IGNORECASE)
+
+    # Label cues match as substrings (e.g. "compute" also hits "computed"),
+    # so they stay regex alternations rather than whole-token set lookups.
+    # One lookahead scan visits every cue start, overlapping ones included;
+    # group order makes the higher-precedence label win at a shared start.
+    _CUE_RE = re.compile(
+        '(?=(?P<DERIVED>' + '|'.join(map(re.escape, DERIVED_CUES)) + ')'
+        '|(?P<COMPUTED>' + '|'.join(map(re.escape, COMPUTED_CUES)) + ')'
+        '|(?P<CITED>' + '|'.join(map(re.escape, CITED_CUES)) + '))',
+        re.IGNORECASE,
+    )
+
     def __init__(self):
         self.leak_pattern = re.compile(
             r'\b(' + '|'.join(re.escape(p) for p in self.LEAK_PHRASES) + r')\b',
             re.IGNORECASE
         )
-        self.equation_patterns = [re.compile(p, re.DOTALL) for p in self.EQUATION_PATTERNS]
+        # Alternation order preserves EQUATION_PATTERNS priority at each position.
+        self.equation_pattern = re.compile(
+            '|'.join(f'(?:{p})' for p in self.EQUATION_PATTERNS), re.DOTALL
+        )
 
     def extract_claims(
         self,
@@ -53,146 +96,147 @@ class ClaimExtractor:
         latex_blocks: Optional[list[str]] = None,
         code_blocks: Optional[list[str]] = None,
     ) -> list[ClaimDraft]:
-        claims = []
-        
-        if latex_blocks:
-            for block in latex_blocks:
-                claims.extend(self._extract_from_latex(block))
-        
-        claims.extend(self._extract_from_text(input_text))
-        
-        return claims
+        # Sub-extractors are generators; materialize once at the public boundary.
+        latex_claims = (
+            claim
+            for block in latex_blocks or ()
+            for claim in self._extract_from_latex(block)
+        )
+        return list(chain(latex_claims, self._extract_from_text(input_text)))
 
-    def _extract_from_latex(self, latex_block: str) -> list[ClaimDraft]:
-        claims = []
-        consumed_spans = []
-        
-        for pattern in self.equation_patterns:
-            for match in pattern.finditer(latex_block):
-                start, end = match.start(), match.end()
-                
-                overlaps = any(
-                    (start < c_end and end > c_start)
-                    for c_start, c_end in consumed_spans
+    def _extract_from_latex(self, latex_block: str) -> Iterator[ClaimDraft]:
+        # Only substantive equations consume their span. A rejected match
+        # (e.g. "$ z $") is retried one character later so it cannot eat the
+        # opening delimiter of the next equation.
+        search = self.equation_pattern.search
+        pos = 0
+        while True:
+            match = search(latex_block, pos)
+            if match is None:
+                return
+            equation_text = match.group(0).strip()
+            if self._is_substantive_equation(equation_text):
+                yield ClaimDraft(
+                    statement=equation_text,
+                    claim_span=(match.start(), match.end()),
+                    suggested_label=ClaimLabel.DERIVED,
                 )
-                if overlaps:
-                    continue
-                
-                equation_text = match.group(0).strip()
-                if self._is_substantive_equation(equation_text):
-                    claims.append(
-                        ClaimDraft(
-                            statement=equation_text,
-                            claim_span=(start, end),
-                            suggested_label=ClaimLabel.DERIVED,
-                        )
-                    )
-                    consumed_spans.append((start, end))
-        
-        return claims
+                pos = match.end()
+            else:
+                pos = match.start() + 1
 
-    def _extract_from_text(self, text: str) -> list[ClaimDraft]:
-        claims = []
+    def _extract_from_text(self, text: str) -> Iterator[ClaimDraft]:
+        spans = list(self._iter_sentence_spans(text))
+        sentence_ends = [end for _, end in spans]
         
-        sentences = self._split_sentences(text)
+        # Scan the whole text once per filter instead of once per sentence.
+        leak_sentences = self._sentences_matching(self.leak_pattern, text, sentence_ends)
+        assertion_sentences = self._sentences_matching(self._ASSERTION_RE, text, sentence_ends)
         
-        for sentence in sentences:
-            sentence_claims = self._extract_from_sentence(sentence)
-            claims.extend(sentence_claims)
+        for idx, (start, end) in enumerate(spans):
+            yield from self._extract_from_sentence(
+                text[start:end],
+                has_leak=idx in leak_sentences,
+                has_assertion=idx in assertion_sentences,
+            )
+
+    @staticmethod
+    def _sentences_matching(
+        pattern: re.Pattern, text: str, sentence_ends: list[int]
+    ) -> set[int]:
+        """Return indices of sentences containing at least one pattern match.
         
-        return claims
+        After a hit the search resumes at the end of that sentence, so each
+        sentence costs at most one match. Sentence boundaries fall on
+        whitespace, so word-boundary patterns behave as they would on the
+        isolated sentence.
+        """
+        hits = set()
+        pos = 0
+        while pos < len(text):
+            match = pattern.search(text, pos)
+            if match is None:
+                break
+            idx = bisect_right(sentence_ends, match.start())
+            if idx == len(sentence_ends):
+                break
+            hits.add(idx)
+            pos = sentence_ends[idx]
+        return hits
 
     def _split_sentences(self, text: str) -> list[str]:
-        sentence_endings = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
-        sentences = sentence_endings.split(text)
-        return [s.strip() for s in sentences if s.strip()]
+        return [text[start:end] for start, end in self._iter_sentence_spans(text)]
+
+    def _iter_sentence_spans(self, text: str) -> Iterator[tuple[int, int]]:
+        """Yield (start, end) offsets of each whitespace-trimmed sentence in text."""
+        prev = 0
+        for match in self._SENT_RE.finditer(text):
+            yield from self._trimmed_span(text, prev, match.start() + 1)
+            prev = match.end()
+        yield from self._trimmed_span(text, prev, len(text))
+
+    @staticmethod
+    def _trimmed_span(text: str, start: int, end: int) -> Iterator[tuple[int, int]]:
+        piece = text[start:end]
+        stripped = piece.strip()
+        if stripped:
+            start += len(piece) - len(piece.lstrip())
+            yield (start, start + len(stripped))
 
-    def _extract_from_sentence(self, sentence: str) -> list[ClaimDraft]:
-        claims = []
+    def _extract_from_sentence(
+        self, sentence: str, has_leak: bool, has_assertion: bool
+    ) -> Iterator[ClaimDraft]:
+        # Sentences with neither trigger can never yield a claim, so skip
+        # the question/definition regex work for them (fragments, labels).
+        if not (has_leak or has_assertion):
+            return
         
         if self._is_question(sentence):
-            return claims
+            return
         
         if self._is_pure_definition(sentence):
-            return claims
+            return
         
-        if self._contains_leak_phrase(sentence):
-            claims.append(
-                ClaimDraft(
-                    statement=sentence,
-                    suggested_label=ClaimLabel.SPECULATIVE,
-                )
+        if has_leak:
+            yield ClaimDraft(
+                statement=sentence,
+                suggested_label=ClaimLabel.SPECULATIVE,
             )
-            return claims
-        
-        if self._contains_assertion(sentence):
-            sub_claims = self._split_multi_claim_sentence(sentence)
-            for claim_statement in sub_claims:
-                label = self._infer_label(claim_statement)
-                claims.append(
-                    ClaimDraft(
-                        statement=claim_statement,
-                        suggested_label=label,
-                    )
-                )
+            return
         
-        return claims
+        for claim_statement in self._split_multi_claim_sentence(sentence):
+            yield ClaimDraft(
+                statement=claim_statement,
+                suggested_label=self._infer_label(claim_statement),
+            )
 
     def _is_question(self, sentence: str) -> bool:
-        return sentence.strip().endswith('?')
+        # Sentences arrive already trimmed from _iter_sentence_spans.
+        return sentence.endswith('?')
     
     def _is_pure_definition(self, sentence: str) -> bool:
-        lower = sentence.lower().strip()
+        if not self._DEF_PREFIX_RE.match(sentence):
+            return False
         
-        for marker in self.DEFINITION_MARKERS:
-            if lower.startswith(marker + " "):
-                if not self._contains_equality_or_relation(sentence):
-                    return True
-                
-                if re.search(r'\b(be|equal|denote)\b', lower) and not re.search(r'\b(then|thus|therefore|hence|so)\b', lower):
-                    return True
+        if not self._contains_equality_or_relation(sentence):
+            return True
         
-        return False
+        return bool(self._DEF_BE_RE.search(sentence)) and not self._DEF_THEN_RE.search(sentence)
 
     def _contains_leak_phrase(self, sentence: str) -> bool:
         return bool(self.leak_pattern.search(sentence))
 
     def _contains_assertion(self, sentence: str) -> bool:
-        assertion_patterns = [
-            r'\b(is|are|equals?|becomes?)\b',
-            r'\b(satisfies?|obeys?|follows?)\b',
-            r'\b(implies?|yields?|gives?)\b',
-            r'\b(therefore|thus|hence|so)\b',
-            r'\bto be\b',
-            r'[=<>≤≥≠≈∝]',
-            r'\b(theorem|lemma|proposition|corollary)\b',
-        ]
-        
-        for pattern in assertion_patterns:
-            if re.search(pattern, sentence, re.IGNORECASE):
-                return True
-        
-        return False
+        return bool(self._ASSERTION_RE.search(sentence))
 
     def _contains_equality_or_relation(self, sentence: str) -> bool:
-        return bool(re.search(r'[=<>≤≥≠≈∝]', sentence))
+        return bool(self._RELATION_RE.search(sentence))
 
     def _split_multi_claim_sentence(self, sentence: str) -> list[str]:
-        if 'according to' in sentence.lower():
+        if self._ACCORDING_TO_RE.search(sentence):
             return [sentence]
         
-        conjunctions = [' and ', ' while ', ' whereas ', ', and ']
-        
-        parts = [sentence]
-        for conj in conjunctions:
-            new_parts = []
-            for part in parts:
-                if conj in part.lower():
-                    split_parts = part.split(conj)
-                    new_parts.extend(split_parts)
-                else:
-                    new_parts.append(part)
-            parts = new_parts
+        parts = self._CONJ_RE.split(sentence)
         
         substantive_parts = []
         for part in parts:
@@ -206,7 +250,8 @@ class ClaimExtractor:
         return substantive_parts
 
     def _is_substantive_claim(self, text: str) -> bool:
-        if len(text.split()) < 3:
+        # maxsplit=2 caps the word list at three entries - enough for the test.
+        if len(text.split(None, 2)) < 3:
             return False
         
         if self._contains_assertion(text):
@@ -215,7 +260,8 @@ class ClaimExtractor:
         return False
 
     def _is_substantive_equation(self, equation_text: str) -> bool:
-        if len(equation_text.strip()) < 3:
+        # Callers pass match text that is already stripped.
+        if len(equation_text) < 3:
             return False
         
         if '=' not in equation_text:
@@ -224,18 +270,25 @@ class ClaimExtractor:
         return True
 
     def _infer_label(self, claim_text: str) -> ClaimLabel:
-        lower = claim_text.lower()
+        # Precedence is DERIVED > COMPUTED > CITED regardless of position.
+        found = None
+        for match in self._CUE_RE.finditer(claim_text):
+            label = match.lastgroup
+            if label == 'DERIVED':
+                return ClaimLabel.DERIVED
+            if found is None or label == 'COMPUTED':
+                found = label
         
-        if any(word in lower for word in ['therefore', 'thus', 'hence', 'implies', 'follows', 'derive']):
-            return ClaimLabel.DERIVED
+        if found is None:
+            return ClaimLabel.SPECULATIVE
         
-        if any(word in lower for word in ['compute', 'calculate', 'evaluate', 'numerical', 'simulate']):
-            return ClaimLabel.COMPUTED
-        
-        if any(word in lower for word in ['theorem', 'lemma', 'proposition', 'according to', 'from ref', 'cite', 'citation']):
-            return ClaimLabel.CITED
-        
-        return ClaimLabel.SPECULATIVE
+        return ClaimLabel[found]
+
+
+@lru_cache(maxsize=1)
+def _default_extractor() -> ClaimExtractor:
+    # ClaimExtractor holds only compiled patterns, so one instance can be shared.
+    return ClaimExtractor()
 
 
 def extract_claims(
@@ -243,5 +296,38 @@ def extract_claims(
     latex_blocks: Optional[list[str]] = None,
     code_blocks: Optional[list[str]] = None,
 ) -> list[ClaimDraft]:
-    extractor = ClaimExtractor()
-    return extractor.extract_claims(input_text, latex_blocks, code_blocks)
+    return _default_extractor().extract_claims(input_text, latex_blocks, code_blocks)
+
+
+def _worker_extract(input_text: str) -> list[ClaimDraft]:
+    # Runs in a pool worker; _default_extractor() compiles once per process.
+    return _default_extractor().extract_claims(input_text)
+
+
+def extract_claims_batch(
+    docs: list[str],
+    workers: Optional[int] = None,
+    use_threads: bool = False,
+) -> list[list[ClaimDraft]]:
+    """Extract claims from independent documents in parallel.
+    
+    Extraction is CPU-bound and shares no state between documents, so the
+    batch is spread over a process pool. Results are returned in input order.
+    Batches of one document, or workers=1, run in-process.
+    
+    use_threads=True swaps in a thread pool, avoiding process start-up and
+    pickling. re holds the GIL while matching, so the thread pool does not
+    run extraction on more than one core at a time.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(docs) <= 1:
+        return [_worker_extract(doc) for doc in docs]
+    
+    if use_threads:
+        # ThreadPoolExecutor.map ignores chunksize
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_worker_extract, docs))
+    
+    chunksize = max(1, len(docs) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_worker_extract, docs, chunksize=chunksize))
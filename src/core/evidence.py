@@ -41,7 +41,40 @@ class IndeterminateReason(Enum):
     TOOL_ERROR = "tool_error"
 
 
-@dataclass
+# GC-5: evidence_type -> required source.kind
+EVIDENCE_TYPE_SOURCE_KIND = {
+    EvidenceType.DERIVATION: "step_id",
+    EvidenceType.COMPUTATION: "tool_run_id",
+    EvidenceType.CITATION: "citation_id",
+}
+
+
+def _validate_strict_token(
+    owner: str, field_name: str, value: object, whitespace_tag: str = "GC-5"
+) -> None:
+    """GC-5: Shared token check - string, non-empty, no leading/trailing whitespace.
+    
+    whitespace_tag is the parenthesised suffix of the whitespace error, which
+    differs between callers.
+    """
+    if not isinstance(value, str):
+        raise TypeError(
+            f"{owner}: {field_name} must be string, got {type(value).__name__} (GC-5)"
+        )
+    
+    stripped = value.strip()
+    if not stripped:
+        raise ValueError(f"{owner}: {field_name} must be non-empty (GC-5)")
+    
+    # GC-5 WIRE-BOUNDARY: NO TRIMMING
+    if value != stripped:
+        raise ValueError(
+            f"{owner}: {field_name} {repr(value)} has leading/trailing whitespace "
+            f"({whitespace_tag})"
+        )
+
+
+@dataclass(slots=True)
 class EvidenceSource:
     """GC-5: Tagged union for evidence source
     
@@ -61,23 +94,10 @@ class EvidenceSource:
                 f"(must be 'step_id', 'tool_run_id', or 'citation_id') (GC-5)"
             )
         
-        # Validate value is non-empty string
-        if not isinstance(self.value, str):
-            raise TypeError(
-                f"EvidenceSource: value must be string, got {type(self.value).__name__} (GC-5)"
-            )
-        
-        if not self.value or not self.value.strip():
-            raise ValueError("EvidenceSource: value must be non-empty (GC-5)")
-        
-        # GC-5 WIRE-BOUNDARY: NO TRIMMING
-        if self.value != self.value.strip():
-            raise ValueError(
-                f"EvidenceSource: value {repr(self.value)} has leading/trailing whitespace (GC-5)"
-            )
+        _validate_strict_token("EvidenceSource", "value", self.value)
 
 
-@dataclass
+@dataclass(slots=True)
 class PayloadRef:
     """GC-5: Tagged union for payload reference
     
@@ -94,23 +114,10 @@ class PayloadRef:
                 f"(must be 'log_id', 'snippet_ref', or 'expression_ref') (GC-5)"
             )
         
-        # Validate value is non-empty string
-        if not isinstance(self.value, str):
-            raise TypeError(
-                f"PayloadRef: value must be string, got {type(self.value).__name__} (GC-5)"
-            )
-        
-        if not self.value or not self.value.strip():
-            raise ValueError("PayloadRef: value must be non-empty (GC-5)")
-        
-        # GC-5 WIRE-BOUNDARY: NO TRIMMING
-        if self.value != self.value.strip():
-            raise ValueError(
-                f"PayloadRef: value {repr(self.value)} has leading/trailing whitespace (GC-5)"
-            )
+        _validate_strict_token("PayloadRef", "value", self.value)
 
 
-@dataclass
+@dataclass(slots=True)
 class EvidenceObject:
     """GC-5: Strict evidence object with typed fields and fail-closed validation
     
@@ -142,21 +149,10 @@ class EvidenceObject:
     
     def __post_init__(self):
         # GC-5: evidence_id strict validation
-        if not isinstance(self.evidence_id, str):
-            raise TypeError(
-                f"EvidenceObject: evidence_id must be string, "
-                f"got {type(self.evidence_id).__name__} (GC-5)"
-            )
-        
-        if not self.evidence_id or not self.evidence_id.strip():
-            raise ValueError("EvidenceObject: evidence_id must be non-empty (GC-5)")
-        
-        # GC-5 WIRE-BOUNDARY: NO TRIMMING
-        if self.evidence_id != self.evidence_id.strip():
-            raise ValueError(
-                f"EvidenceObject: evidence_id {repr(self.evidence_id)} has leading/trailing "
-                f"whitespace (GC-5: whitespace variants rejected)"
-            )
+        _validate_strict_token(
+            "EvidenceObject", "evidence_id", self.evidence_id,
+            whitespace_tag="GC-5: whitespace variants rejected",
+        )
         
         # GC-5: Type validation for enums
         if not isinstance(self.evidence_type, EvidenceType):
@@ -184,13 +180,7 @@ class EvidenceObject:
             )
         
         # GC-5: Alignment rule - evidence_type ↔ source.kind
-        alignment = {
-            EvidenceType.DERIVATION: "step_id",
-            EvidenceType.COMPUTATION: "tool_run_id",
-            EvidenceType.CITATION: "citation_id",
-        }
-        
-        expected_kind = alignment[self.evidence_type]
+        expected_kind = EVIDENCE_TYPE_SOURCE_KIND[self.evidence_type]
         if self.source.kind != expected_kind:
             raise ValueError(
                 f"EvidenceObject: EVIDENCE_SOURCE_KIND_MISMATCH - "
@@ -12,8 +12,10 @@ Validation Rules:
 - EVIDENCE_IDS_WRONG_TYPE: evidence_ids must be list of strings
 """
 
+from collections import Counter
 from typing import Any
 from src.core.claim import Claim, ClaimLabel
+from src.core.id_parsers import _INVISIBLE_CHARS, _wire_repr
 from src.core.report import ScientificReport
 
 
@@ -49,51 +51,43 @@ def parse_evidence_id(wire: Any) -> str:
     if not isinstance(wire, str):
         type_name = type(wire).__name__
         raise TypeError(
-            f"Invalid evidence_id: {repr(wire)} (expected string, got {type_name}) (GC-4)"
+            f"Invalid evidence_id: {_wire_repr(wire)} (expected string, got {type_name}) (GC-4)"
         )
     
     # Empty check
     if wire == "":
         raise ValueError("Invalid evidence_id: empty string (GC-4)")
     
+    ascii_only = wire.isascii()
+    
     # Check for unicode invisibles FIRST (before whitespace checks)
-    # Common invisibles: U+200B (ZWSP), U+00A0 (NBSP), U+FEFF (BOM), U+2060 (WJ)
-    # Note: NBSP is both invisible AND whitespace, so check invisibles first
-    invisible_chars = [
-        '\u200b',  # ZWSP
-        '\u00a0',  # NBSP
-        '\ufeff',  # BOM
-        '\u2060',  # Word Joiner
-        '\u200c',  # ZWNJ
-        '\u200d',  # ZWJ
-    ]
-    
-    for invisible in invisible_chars:
-        if invisible in wire:
-            raise ValueError(
-                f"Invalid evidence_id: {repr(wire)} contains invisible unicode character (GC-4)"
-            )
+    # Note: NBSP is both invisible AND whitespace, so check invisibles first.
+    # All invisibles are non-ASCII, so pure-ASCII input skips the scan.
+    if not ascii_only and not _INVISIBLE_CHARS.isdisjoint(wire):
+        raise ValueError(
+            f"Invalid evidence_id: {_wire_repr(wire)} contains invisible unicode character (GC-4)"
+        )
+    
+    stripped = wire.strip()
     
     # Whitespace-only check
-    if not wire.strip():
+    if not stripped:
         raise ValueError(
-            f"Invalid evidence_id: {repr(wire)} is whitespace-only (GC-4)"
+            f"Invalid evidence_id: {_wire_repr(wire)} is whitespace-only (GC-4)"
         )
     
     # GC-4 WIRE-BOUNDARY HARDENING: NO TRIMMING
     # Reject any leading/trailing whitespace variants
-    if wire != wire.strip():
+    if wire != stripped:
         raise ValueError(
-            f"Invalid evidence_id: {repr(wire)} has leading/trailing whitespace "
+            f"Invalid evidence_id: {_wire_repr(wire)} has leading/trailing whitespace "
             f"(GC-4: whitespace variants rejected at wire boundary)"
         )
     
     # Check for non-ASCII (catches unicode confusables)
-    try:
-        wire.encode('ascii')
-    except UnicodeEncodeError:
+    if not ascii_only:
         raise ValueError(
-            f"Invalid evidence_id: {repr(wire)} contains non-ASCII characters (GC-4)"
+            f"Invalid evidence_id: {_wire_repr(wire)} contains non-ASCII characters (GC-4)"
         )
     
     # Return exact value (NO TRIMMING)
@@ -123,7 +117,7 @@ def parse_evidence_ids(wire: Any) -> list[str]:
     if not isinstance(wire, list):
         type_name = type(wire).__name__
         raise TypeError(
-            f"Invalid evidence_ids: {repr(wire)} (expected list, got {type_name}) (GC-4)"
+            f"Invalid evidence_ids: {_wire_repr(wire)} (expected list, got {type_name}) (GC-4)"
         )
     
     # Parse each evidence_id
@@ -138,8 +132,8 @@ def parse_evidence_ids(wire: Any) -> list[str]:
             ) from e
     
     # Check for duplicates
-    if len(parsed_ids) != len(set(parsed_ids)):
-        duplicates = [eid for eid in parsed_ids if parsed_ids.count(eid) > 1]
+    duplicates = [eid for eid, count in Counter(parsed_ids).items() if count > 1]
+    if duplicates:
         raise ValueError(
             f"Invalid evidence_ids: duplicate entries found: {set(duplicates)} "
             f"(GC-4: EVIDENCE_ID_DUP_IN_CLAIM)"
@@ -163,10 +157,23 @@ class EvidenceValidator:
         Returns:
             (is_valid, errors) where errors are error category strings
         """
+        existing_evidence_ids = frozenset(e.evidence_id for e in report.evidence)
+        return EvidenceValidator._validate_claim_evidence_with_index(claim, existing_evidence_ids)
+    
+    @staticmethod
+    def _validate_claim_evidence_with_index(
+        claim: Claim, existing_evidence_ids: frozenset[str]
+    ) -> tuple[bool, list[str]]:
+        """
+        Validate a single claim against a prebuilt set of report evidence_ids.
+        
+        Lets validate_report_evidence build the evidence index once per report
+        instead of once per claim.
+        """
         errors = []
         
         # Rule: NON_SPEC_MISSING_EVIDENCE
-        if claim.claim_label != ClaimLabel.SPECULATIVE:
+        if claim.claim_label is not ClaimLabel.SPECULATIVE:
             if not claim.evidence_ids or len(claim.evidence_ids) == 0:
                 errors.append(
                     f"NON_SPEC_MISSING_EVIDENCE: Claim {claim.claim_id} "
@@ -174,37 +181,47 @@ class EvidenceValidator:
                 )
         
         # Rule: SPEC_MISSING_VERIFY_FALSIFY
-        if claim.claim_label == ClaimLabel.SPECULATIVE:
+        if claim.claim_label is ClaimLabel.SPECULATIVE:
             if claim.verify_falsify is None or not claim.verify_falsify.strip():
                 errors.append(
                     f"SPEC_MISSING_VERIFY_FALSIFY: Claim {claim.claim_id} "
                     f"(label=SPECULATIVE) must have non-empty verify_falsify (GC-4)"
                 )
         
-        # Rule: EVIDENCE_ID_EMPTY (check each evidence_id)
+        # Single pass over evidence_ids; errors are still emitted grouped by rule
+        empty_errors = []
+        dangling_errors = []
+        seen = set()
+        duplicates = set()
         for idx, eid in enumerate(claim.evidence_ids):
+            # Rule: EVIDENCE_ID_EMPTY
             if not eid or not eid.strip():
-                errors.append(
+                empty_errors.append(
                     f"EVIDENCE_ID_EMPTY: Claim {claim.claim_id} evidence_ids[{idx}] "
                     f"is empty or whitespace-only (GC-4)"
                 )
+            # Rule: DANGLING_EVIDENCE_ID
+            elif eid not in existing_evidence_ids:
+                dangling_errors.append(
+                    f"DANGLING_EVIDENCE_ID: Claim {claim.claim_id} references non-existent "
+                    f"evidence_id: {eid} (GC-4)"
+                )
+            
+            if eid in seen:
+                duplicates.add(eid)
+            else:
+                seen.add(eid)
+        
+        errors.extend(empty_errors)
         
         # Rule: EVIDENCE_ID_DUP_IN_CLAIM
-        if len(claim.evidence_ids) != len(set(claim.evidence_ids)):
-            duplicates = [eid for eid in claim.evidence_ids if claim.evidence_ids.count(eid) > 1]
+        if duplicates:
             errors.append(
                 f"EVIDENCE_ID_DUP_IN_CLAIM: Claim {claim.claim_id} has duplicate evidence_ids: "
-                f"{set(duplicates)} (GC-4)"
+                f"{duplicates} (GC-4)"
             )
         
-        # Rule: DANGLING_EVIDENCE_ID
-        existing_evidence_ids = {e.evidence_id for e in report.evidence}
-        for eid in claim.evidence_ids:
-            if eid and eid.strip() and eid not in existing_evidence_ids:
-                errors.append(
-                    f"DANGLING_EVIDENCE_ID: Claim {claim.claim_id} references non-existent "
-                    f"evidence_id: {eid} (GC-4)"
-                )
+        errors.extend(dangling_errors)
         
         return (len(errors) == 0, errors)
     
@@ -217,9 +234,12 @@ class EvidenceValidator:
             (is_valid, errors) where errors are error category strings
         """
         all_errors = []
+        existing_evidence_ids = frozenset(e.evidence_id for e in report.evidence)
         
         for claim in report.claims:
-            is_valid, errors = EvidenceValidator.validate_claim_evidence(claim, report)
+            is_valid, errors = EvidenceValidator._validate_claim_evidence_with_index(
+                claim, existing_evidence_ids
+            )
             all_errors.extend(errors)
         
         return (len(all_errors) == 0, all_errors)
@@ -14,23 +14,26 @@ Validation rules:
 - Evidence ID collision detection in report
 """
 
+from dataclasses import dataclass
 from typing import List, Tuple
-from src.core.evidence import EvidenceObject, EvidenceType
+from src.core.evidence import EVIDENCE_TYPE_SOURCE_KIND, EvidenceObject, EvidenceType
 from src.core.report import ScientificReport
 
 
+# validate_evidence_object has no context-dependent checks yet and always
+# passes; set True once it does so validate_report_evidence calls it again.
+_EVIDENCE_CONTEXT_CHECKS = False
+
+
+@dataclass(frozen=True, slots=True)
 class GC5ValidationError:
-    """Structured validation error for GC-5"""
+    """Structured validation error for GC-5 (hashable, so repeats can be deduplicated)"""
     
-    def __init__(self, category: str, message: str):
-        self.category = category
-        self.message = message
+    category: str
+    message: str
     
     def __str__(self) -> str:
         return f"{self.category}: {self.message}"
-    
-    def __repr__(self) -> str:
-        return f"GC5ValidationError(category={self.category!r}, message={self.message!r})"
 
 
 def validate_evidence_object(evidence: EvidenceObject) -> Tuple[bool, List[str]]:
@@ -77,11 +80,12 @@ def validate_report_evidence(report: ScientificReport) -> Tuple[bool, List[str]]
     # Check for evidence_id collisions (already done in ScientificReport.__post_init__)
     # But we can add additional validation here if needed
     
-    # Validate each evidence object
-    for evidence in report.evidence:
-        is_valid, evidence_errors = validate_evidence_object(evidence)
-        if not is_valid:
-            errors.extend(evidence_errors)
+    # Validate each evidence object (skipped while there are no context checks)
+    if _EVIDENCE_CONTEXT_CHECKS:
+        for evidence in report.evidence:
+            is_valid, evidence_errors = validate_evidence_object(evidence)
+            if not is_valid:
+                errors.extend(evidence_errors)
     
     return (len(errors) == 0, errors)
 
@@ -107,13 +111,7 @@ def validate_evidence_type_source_alignment(
         - is_valid: True if aligned, False otherwise
         - error_message: Empty string if valid, error message otherwise
     """
-    alignment = {
-        EvidenceType.DERIVATION: "step_id",
-        EvidenceType.COMPUTATION: "tool_run_id",
-        EvidenceType.CITATION: "citation_id",
-    }
-    
-    expected_kind = alignment[evidence_type]
+    expected_kind = EVIDENCE_TYPE_SOURCE_KIND[evidence_type]
     if source_kind != expected_kind:
         error_msg = (
             f"EVIDENCE_SOURCE_KIND_MISMATCH: evidence_type={evidence_type.value} "
@@ -22,33 +22,47 @@ from src.core.evidence import (
     EvidenceSource,
     PayloadRef,
 )
+from src.core.id_parsers import _INVISIBLE_CHARS, _wire_repr
+
+
+# Wire value -> member maps; one dict lookup instead of the Enum call path
+_EVIDENCE_TYPE_MAP = {e.value: e for e in EvidenceType}
+_EVIDENCE_STATUS_MAP = {e.value: e for e in EvidenceStatus}
+_INDETERMINATE_REASON_MAP = {e.value: e for e in IndeterminateReason}
+
+_SOURCE_KINDS = frozenset({"step_id", "tool_run_id", "citation_id"})
+_PAYLOAD_REF_KINDS = frozenset({"log_id", "snippet_ref", "expression_ref"})
+
+_REQUIRED_EVIDENCE_FIELDS = ("evidence_id", "evidence_type", "source", "status", "payload_ref")
+_REQUIRED_EVIDENCE_FIELD_SET = frozenset(_REQUIRED_EVIDENCE_FIELDS)
+
+
+def _is_clean_token(value: str) -> bool:
+    """Fast path: True if value is non-empty and entirely printable ASCII (0x21-0x7E)
+
+    A token passing this check cannot fail any of the per-rule checks below,
+    so only rejects fall through to rule-by-rule classification, which keeps
+    the error precedence deterministic. isascii()/isprintable() read the
+    string's compact ASCII flag / buffer in C; space is the only printable
+    ASCII character outside the token range.
+    """
+    return value != "" and value.isascii() and value.isprintable() and ' ' not in value
 
 
 def _check_unicode_invisibles(value: str, field_name: str) -> None:
     """Check for unicode invisible characters"""
-    invisible_chars = [
-        '\u200b',  # ZWSP
-        '\u00a0',  # NBSP
-        '\ufeff',  # BOM
-        '\u2060',  # Word Joiner
-        '\u200c',  # ZWNJ
-        '\u200d',  # ZWJ
-    ]
-    
-    for invisible in invisible_chars:
-        if invisible in value:
-            raise ValueError(
-                f"Invalid {field_name}: {repr(value)} contains invisible unicode character (GC-5)"
-            )
+    # All invisibles are non-ASCII, so pure-ASCII values skip the scan
+    if not value.isascii() and not _INVISIBLE_CHARS.isdisjoint(value):
+        raise ValueError(
+            f"Invalid {field_name}: {_wire_repr(value)} contains invisible unicode character (GC-5)"
+        )
 
 
 def _check_non_ascii(value: str, field_name: str) -> None:
     """Check for non-ASCII characters (confusables)"""
-    try:
-        value.encode('ascii')
-    except UnicodeEncodeError:
+    if not value.isascii():
         raise ValueError(
-            f"Invalid {field_name}: {repr(value)} contains non-ASCII characters (GC-5)"
+            f"Invalid {field_name}: {_wire_repr(value)} contains non-ASCII characters (GC-5)"
         )
 
 
@@ -56,7 +70,7 @@ def _check_internal_whitespace(value: str, field_name: str) -> None:
     """Check for internal whitespace in ID tokens (space, tab, newline)"""
     if ' ' in value or '\t' in value or '\n' in value or '\r' in value:
         raise ValueError(
-            f"Invalid {field_name}: {repr(value)} contains internal whitespace (GC-5)"
+            f"Invalid {field_name}: {_wire_repr(value)} contains internal whitespace (GC-5)"
         )
 
 
@@ -89,27 +103,29 @@ def parse_evidence_id(wire: Any) -> str:
     if not isinstance(wire, str):
         type_name = type(wire).__name__
         raise TypeError(
-            f"Invalid evidence_id: {repr(wire)} (expected string, got {type_name}) (GC-5)"
+            f"Invalid evidence_id: {_wire_repr(wire)} (expected string, got {type_name}) (GC-5)"
         )
     
     # Empty check
     if wire == "":
         raise ValueError("Invalid evidence_id: empty string (GC-5)")
     
+    if _is_clean_token(wire):
+        return wire
+    
     # Check for unicode invisibles FIRST (before whitespace checks)
     _check_unicode_invisibles(wire, "evidence_id")
     
-    # Whitespace-only check
-    if not wire.strip():
-        raise ValueError(
-            f"Invalid evidence_id: {repr(wire)} is whitespace-only (GC-5)"
-        )
-    
     # GC-5 WIRE-BOUNDARY: NO TRIMMING
-    # Reject any leading/trailing whitespace variants
-    if wire != wire.strip():
+    # Reject any leading/trailing whitespace variants (whitespace-only first)
+    stripped = wire.strip()
+    if stripped != wire:
+        if not stripped:
+            raise ValueError(
+                f"Invalid evidence_id: {_wire_repr(wire)} is whitespace-only (GC-5)"
+            )
         raise ValueError(
-            f"Invalid evidence_id: {repr(wire)} has leading/trailing whitespace "
+            f"Invalid evidence_id: {_wire_repr(wire)} has leading/trailing whitespace "
             f"(GC-5: whitespace variants rejected at wire boundary)"
         )
     
@@ -147,18 +163,17 @@ def parse_evidence_type(wire: Any) -> EvidenceType:
     if not isinstance(wire, str):
         type_name = type(wire).__name__
         raise ValueError(
-            f"Invalid evidence_type: {repr(wire)} (expected string, got {type_name}) (GC-5: EVIDENCE_TYPE_INVALID)"
+            f"Invalid evidence_type: {_wire_repr(wire)} (expected string, got {type_name}) (GC-5: EVIDENCE_TYPE_INVALID)"
         )
     
     # Exact match, case-sensitive
-    try:
-        return EvidenceType(wire)
-    except ValueError:
-        valid_values = [e.value for e in EvidenceType]
+    member = _EVIDENCE_TYPE_MAP.get(wire)
+    if member is None:
         raise ValueError(
-            f"Invalid evidence_type: {repr(wire)} "
-            f"(must be one of {valid_values}, case-sensitive) (GC-5: EVIDENCE_TYPE_INVALID)"
+            f"Invalid evidence_type: {_wire_repr(wire)} "
+            f"(must be one of {list(_EVIDENCE_TYPE_MAP)}, case-sensitive) (GC-5: EVIDENCE_TYPE_INVALID)"
         )
+    return member
 
 
 def parse_evidence_status(wire: Any) -> EvidenceStatus:
@@ -186,18 +201,17 @@ def parse_evidence_status(wire: Any) -> EvidenceStatus:
     if not isinstance(wire, str):
         type_name = type(wire).__name__
         raise ValueError(
-            f"Invalid evidence status: {repr(wire)} (expected string, got {type_name}) (GC-5: EVIDENCE_STATUS_INVALID)"
+            f"Invalid evidence status: {_wire_repr(wire)} (expected string, got {type_name}) (GC-5: EVIDENCE_STATUS_INVALID)"
         )
     
     # Exact match, case-sensitive
-    try:
-        return EvidenceStatus(wire)
-    except ValueError:
-        valid_values = [e.value for e in EvidenceStatus]
+    member = _EVIDENCE_STATUS_MAP.get(wire)
+    if member is None:
         raise ValueError(
-            f"Invalid evidence status: {repr(wire)} "
-            f"(must be one of {valid_values}, case-sensitive) (GC-5: EVIDENCE_STATUS_INVALID)"
+            f"Invalid evidence status: {_wire_repr(wire)} "
+            f"(must be one of {list(_EVIDENCE_STATUS_MAP)}, case-sensitive) (GC-5: EVIDENCE_STATUS_INVALID)"
         )
+    return member
 
 
 def parse_indeterminate_reason(wire: Any) -> IndeterminateReason:
@@ -225,67 +239,56 @@ def parse_indeterminate_reason(wire: Any) -> IndeterminateReason:
     if not isinstance(wire, str):
         type_name = type(wire).__name__
         raise ValueError(
-            f"Invalid indeterminate_reason: {repr(wire)} (expected string, got {type_name}) (GC-5: INDETERMINATE_REASON_INVALID)"
+            f"Invalid indeterminate_reason: {_wire_repr(wire)} (expected string, got {type_name}) (GC-5: INDETERMINATE_REASON_INVALID)"
         )
     
     # Exact match, case-sensitive
-    try:
-        return IndeterminateReason(wire)
-    except ValueError:
-        valid_values = [e.value for e in IndeterminateReason]
+    member = _INDETERMINATE_REASON_MAP.get(wire)
+    if member is None:
         raise ValueError(
-            f"Invalid indeterminate_reason: {repr(wire)} "
-            f"(must be one of {valid_values}, case-sensitive) (GC-5: INDETERMINATE_REASON_INVALID)"
+            f"Invalid indeterminate_reason: {_wire_repr(wire)} "
+            f"(must be one of {list(_INDETERMINATE_REASON_MAP)}, case-sensitive) (GC-5: INDETERMINATE_REASON_INVALID)"
         )
+    return member
 
 
-def parse_evidence_source(wire: Any) -> EvidenceSource:
-    """
-    WIRE BOUNDARY PARSER - Parse evidence source tagged union from raw input.
-    
-    Strict rules (GC-5):
-    - Must be a JSON object with "kind" and "value" keys
-    - kind must be one of: "step_id", "tool_run_id", "citation_id"
-    - value must be a strict token (ASCII, no whitespace variants, no invisibles)
-    
-    Args:
-        wire: Raw value from external source
-        
-    Returns:
-        EvidenceSource object
-        
-    Raises:
-        TypeError: If wire is not a dict or fields have wrong types
-        ValueError: If wire violates any validation rule
-    """
+def _parse_tagged_token(
+    wire: Any,
+    name: str,
+    allowed_kinds: frozenset,
+    kind_choices: str,
+    category: str,
+    ctor,
+):
+    """Shared GC-5 parser for {"kind": ..., "value": <strict token>} tagged unions"""
     if wire is None:
-        raise ValueError("Invalid evidence source: None (GC-5)")
+        raise ValueError(f"Invalid {name}: None (GC-5)")
     
     if not isinstance(wire, dict):
         type_name = type(wire).__name__
         raise TypeError(
-            f"Invalid evidence source: {repr(wire)} (expected dict, got {type_name}) (GC-5)"
+            f"Invalid {name}: {_wire_repr(wire)} (expected dict, got {type_name}) (GC-5)"
         )
     
     # Check required keys
     if "kind" not in wire:
-        raise ValueError("Invalid evidence source: missing 'kind' field (GC-5)")
+        raise ValueError(f"Invalid {name}: missing 'kind' field (GC-5)")
     
     if "value" not in wire:
-        raise ValueError("Invalid evidence source: missing 'value' field (GC-5)")
+        raise ValueError(f"Invalid {name}: missing 'value' field (GC-5)")
     
     # Parse kind
     kind = wire["kind"]
     if not isinstance(kind, str):
         type_name = type(kind).__name__
         raise ValueError(
-            f"Invalid evidence source kind: {repr(kind)} (expected string, got {type_name}) (GC-5: SOURCE_KIND_INVALID)"
+            f"Invalid {name} kind: {_wire_repr(kind)} (expected string, got {type_name}) (GC-5: {category}_KIND_INVALID)"
         )
     
-    if kind not in ["step_id", "tool_run_id", "citation_id"]:
+    if kind not in allowed_kinds:
         raise ValueError(
-            f"Invalid evidence source kind: {repr(kind)} "
-            f"(must be 'step_id', 'tool_run_id', or 'citation_id') (GC-5: SOURCE_KIND_INVALID)"
+            f"Invalid {name} kind: {_wire_repr(kind)} "
+            f"(must be {kind_choices}) (GC-5: {category}_KIND_INVALID)"
         )
     
     # Parse value with strict token validation
@@ -293,28 +296,61 @@ def parse_evidence_source(wire: Any) -> EvidenceSource:
     if not isinstance(value, str):
         type_name = type(value).__name__
         raise TypeError(
-            f"Invalid evidence source value: {repr(value)} (expected string, got {type_name}) (GC-5: SOURCE_VALUE_INVALID)"
+            f"Invalid {name} value: {_wire_repr(value)} (expected string, got {type_name}) (GC-5: {category}_VALUE_INVALID)"
         )
     
-    if not value or not value.strip():
-        raise ValueError("Invalid evidence source value: empty or whitespace-only (GC-5: SOURCE_VALUE_INVALID)")
+    if _is_clean_token(value):
+        return ctor(kind=kind, value=value)
+    
+    stripped = value.strip()
+    if not stripped:
+        raise ValueError(f"Invalid {name} value: empty or whitespace-only (GC-5: {category}_VALUE_INVALID)")
     
     # Check for unicode invisibles
-    _check_unicode_invisibles(value, "evidence source value")
+    _check_unicode_invisibles(value, f"{name} value")
     
     # NO TRIMMING - reject whitespace variants
-    if value != value.strip():
+    if value != stripped:
         raise ValueError(
-            f"Invalid evidence source value: {repr(value)} has leading/trailing whitespace (GC-5: SOURCE_VALUE_INVALID)"
+            f"Invalid {name} value: {_wire_repr(value)} has leading/trailing whitespace (GC-5: {category}_VALUE_INVALID)"
         )
     
     # Check for non-ASCII
-    _check_non_ascii(value, "evidence source value")
+    _check_non_ascii(value, f"{name} value")
     
     # Check for internal whitespace
-    _check_internal_whitespace(value, "evidence source value")
+    _check_internal_whitespace(value, f"{name} value")
     
-    return EvidenceSource(kind=kind, value=value)
+    return ctor(kind=kind, value=value)
+
+
+def parse_evidence_source(wire: Any) -> EvidenceSource:
+    """
+    WIRE BOUNDARY PARSER - Parse evidence source tagged union from raw input.
+    
+    Strict rules (GC-5):
+    - Must be a JSON object with "kind" and "value" keys
+    - kind must be one of: "step_id", "tool_run_id", "citation_id"
+    - value must be a strict token (ASCII, no whitespace variants, no invisibles)
+    
+    Args:
+        wire: Raw value from external source
+        
+    Returns:
+        EvidenceSource object
+        
+    Raises:
+        TypeError: If wire is not a dict or fields have wrong types
+        ValueError: If wire violates any validation rule
+    """
+    return _parse_tagged_token(
+        wire,
+        "evidence source",
+        _SOURCE_KINDS,
+        "'step_id', 'tool_run_id', or 'citation_id'",
+        "SOURCE",
+        EvidenceSource,
+    )
 
 
 def parse_payload_ref(wire: Any) -> PayloadRef:
@@ -336,63 +372,14 @@ def parse_payload_ref(wire: Any) -> PayloadRef:
         TypeError: If wire is not a dict or fields have wrong types
         ValueError: If wire violates any validation rule
     """
-    if wire is None:
-        raise ValueError("Invalid payload_ref: None (GC-5)")
-    
-    if not isinstance(wire, dict):
-        type_name = type(wire).__name__
-        raise TypeError(
-            f"Invalid payload_ref: {repr(wire)} (expected dict, got {type_name}) (GC-5)"
-        )
-    
-    # Check required keys
-    if "kind" not in wire:
-        raise ValueError("Invalid payload_ref: missing 'kind' field (GC-5)")
-    
-    if "value" not in wire:
-        raise ValueError("Invalid payload_ref: missing 'value' field (GC-5)")
-    
-    # Parse kind
-    kind = wire["kind"]
-    if not isinstance(kind, str):
-        type_name = type(kind).__name__
-        raise ValueError(
-            f"Invalid payload_ref kind: {repr(kind)} (expected string, got {type_name}) (GC-5: PAYLOAD_REF_KIND_INVALID)"
-        )
-    
-    if kind not in ["log_id", "snippet_ref", "expression_ref"]:
-        raise ValueError(
-            f"Invalid payload_ref kind: {repr(kind)} "
-            f"(must be 'log_id', 'snippet_ref', or 'expression_ref') (GC-5: PAYLOAD_REF_KIND_INVALID)"
-        )
-    
-    # Parse value with strict token validation
-    value = wire["value"]
-    if not isinstance(value, str):
-        type_name = type(value).__name__
-        raise TypeError(
-            f"Invalid payload_ref value: {repr(value)} (expected string, got {type_name}) (GC-5: PAYLOAD_REF_VALUE_INVALID)"
-        )
-    
-    if not value or not value.strip():
-        raise ValueError("Invalid payload_ref value: empty or whitespace-only (GC-5: PAYLOAD_REF_VALUE_INVALID)")
-    
-    # Check for unicode invisibles
-    _check_unicode_invisibles(value, "payload_ref value")
-    
-    # NO TRIMMING - reject whitespace variants
-    if value != value.strip():
-        raise ValueError(
-            f"Invalid payload_ref value: {repr(value)} has leading/trailing whitespace (GC-5: PAYLOAD_REF_VALUE_INVALID)"
-        )
-    
-    # Check for non-ASCII
-    _check_non_ascii(value, "payload_ref value")
-    
-    # Check for internal whitespace
-    _check_internal_whitespace(value, "payload_ref value")
-    
-    return PayloadRef(kind=kind, value=value)
+    return _parse_tagged_token(
+        wire,
+        "payload_ref",
+        _PAYLOAD_REF_KINDS,
+        "'log_id', 'snippet_ref', or 'expression_ref'",
+        "PAYLOAD_REF",
+        PayloadRef,
+    )
 
 
 def parse_evidence_object(wire: Any) -> EvidenceObject:
@@ -422,16 +409,16 @@ def parse_evidence_object(wire: Any) -> EvidenceObject:
     if not isinstance(wire, dict):
         type_name = type(wire).__name__
         raise TypeError(
-            f"Invalid evidence object: {repr(wire)} (expected dict, got {type_name}) (GC-5)"
+            f"Invalid evidence object: {_wire_repr(wire)} (expected dict, got {type_name}) (GC-5)"
         )
     
-    # Check required fields
-    required_fields = ["evidence_id", "evidence_type", "source", "status", "payload_ref"]
-    for field in required_fields:
-        if field not in wire:
-            raise ValueError(
-                f"Invalid evidence object: missing required field '{field}' (GC-5: EVIDENCE_MISSING_FIELD_{field.upper()})"
-            )
+    # Check required fields; report the first missing one in declaration order
+    missing = _REQUIRED_EVIDENCE_FIELD_SET - wire.keys()
+    if missing:
+        field = next(f for f in _REQUIRED_EVIDENCE_FIELDS if f in missing)
+        raise ValueError(
+            f"Invalid evidence object: missing required field '{field}' (GC-5: EVIDENCE_MISSING_FIELD_{field.upper()})"
+        )
     
     # Parse each field with strict validation
     evidence_id = parse_evidence_id(wire["evidence_id"])
@@ -452,7 +439,7 @@ def parse_evidence_object(wire: Any) -> EvidenceObject:
         if not isinstance(notes, str):
             type_name = type(notes).__name__
             raise TypeError(
-                f"Invalid notes: {repr(notes)} (expected string, got {type_name}) (GC-5)"
+                f"Invalid notes: {_wire_repr(notes)} (expected string, got {type_name}) (GC-5)"
             )
     
     # Construct EvidenceObject (will trigger __post_init__ validation)
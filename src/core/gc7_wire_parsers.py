@@ -6,6 +6,7 @@ Parsers for step_status and status_reason with no trimming at wire boundary.
 
 from typing import Any, Optional
 from src.core.step import StepStatus
+from src.core.id_parsers import _INVISIBLE_CHARS
 
 
 def parse_step_status(wire: Any) -> StepStatus:
@@ -104,8 +105,7 @@ def parse_status_reason(wire: Any, required: bool = False) -> Optional[str]:
     # Check for invisible-only content after ASCII whitespace trim
     # If trimmed is non-empty but contains only invisible Unicode, treat as empty
     if trimmed:
-        invisible_chars = {'\u200b', '\u00a0', '\ufeff', '\u2060', '\u200c', '\u200d'}
-        if all(c in invisible_chars for c in trimmed):
+        if _INVISIBLE_CHARS.issuperset(trimmed):
             trimmed = ""
     
     if trimmed == "":
@@ -15,6 +15,7 @@ Validation layering:
 
 from typing import Any, Optional
 from dataclasses import dataclass
+from src.core.id_parsers import _INVISIBLE_CHARS
 
 
 @dataclass
@@ -97,8 +98,7 @@ def parse_statement(wire: Any) -> str:
     
     # Check for invisible-only content after ASCII whitespace trim
     if trimmed:
-        invisible_chars = {'\u200b', '\u00a0', '\ufeff', '\u2060', '\u200c', '\u200d'}
-        if all(c in invisible_chars for c in trimmed):
+        if _INVISIBLE_CHARS.issuperset(trimmed):
             trimmed = ""
     
     if trimmed == "":
@@ -5,6 +5,7 @@ Strict parsers for claim_id, step_id, tool_run_id, citation_id.
 Reject-only posture (no trimming), matching GC-2/GC-4 wire-boundary hardening.
 """
 
+import sys
 from typing import Any
 
 
@@ -17,6 +18,23 @@ UNICODE_INVISIBLES = [
     '\u200C',  # ZWNJ (Zero Width Non-Joiner)
     '\u200D',  # ZWJ (Zero Width Joiner)
 ]
+_INVISIBLE_CHARS = frozenset(UNICODE_INVISIBLES)
+
+# Longest repr of a wire value echoed in an error message
+_WIRE_REPR_LIMIT = 80
+
+
+def _wire_repr(value: Any) -> str:
+    """repr() of a wire value, cut to _WIRE_REPR_LIMIT characters plus '...'."""
+    truncated = False
+    if isinstance(value, str) and len(value) > _WIRE_REPR_LIMIT:
+        # Only escape the prefix that can be kept, not the whole wire string
+        value = value[:_WIRE_REPR_LIMIT]
+        truncated = True
+    text = repr(value)
+    if truncated or len(text) > _WIRE_REPR_LIMIT:
+        return text[:_WIRE_REPR_LIMIT] + "..."
+    return text
 
 
 def _check_id_string(wire: Any, id_type: str) -> str:
@@ -35,7 +53,7 @@ def _check_id_string(wire: Any, id_type: str) -> str:
         id_type: Type of ID for error messages (e.g., "claim_id")
     
     Returns:
-        Validated ID string
+        Validated ID string (interned)
     
     Raises:
         TypeError: If wire is not a string
@@ -53,13 +71,19 @@ def _check_id_string(wire: Any, id_type: str) -> str:
     if wire == "":
         raise ValueError(f"Invalid {id_type}: empty string")
     
+    # Every invisible is non-ASCII; isascii() reads a flag on the str object,
+    # so the common ASCII case skips both the invisible and non-ASCII scans
+    ascii_only = wire.isascii()
+    
     # Check for unicode invisibles FIRST (before whitespace check)
-    for invisible in UNICODE_INVISIBLES:
-        if invisible in wire:
-            raise ValueError(
-                f"Invalid {id_type}: contains unicode invisible character "
-                f"(U+{ord(invisible):04X})"
-            )
+    # One C-level pass decides; the list walk only picks the code point to report
+    if not ascii_only and not _INVISIBLE_CHARS.isdisjoint(wire):
+        for invisible in UNICODE_INVISIBLES:
+            if invisible in wire:
+                raise ValueError(
+                    f"Invalid {id_type}: contains unicode invisible character "
+                    f"(U+{ord(invisible):04X})"
+                )
     
     # Check for leading/trailing whitespace (REJECT, do not trim)
     if wire != wire.strip():
@@ -68,13 +92,15 @@ def _check_id_string(wire: Any, id_type: str) -> str:
         )
     
     # Check for non-ASCII characters
-    try:
-        wire.encode('ascii')
-    except UnicodeEncodeError:
+    if not ascii_only:
         raise ValueError(
             f"Invalid {id_type}: contains non-ASCII characters"
         )
     
+    # Intern so every occurrence of an ID (as a key, in claim_ids, in
+    # depends_on) shares one object; sys.intern rejects str subclasses
+    if type(wire) is str:
+        return sys.intern(wire)
     return wire
 
 
@@ -0,0 +1,28 @@
+"""
+Process-local ID generation for Claim and DerivationStep.
+
+IDs only need to be unique within a process's reports, so a random
+per-process prefix plus a counter replaces a uuid4() call per ID.
+"""
+
+import itertools
+import os
+import secrets
+
+
+class IdSource:
+    """Yields "<tag>-<random prefix>-<counter>" IDs; reseeded in forked children."""
+    
+    def __init__(self, tag: str):
+        self.tag = tag
+        self._reset()
+        # Forked workers must not replay the parent's prefix/counter sequence.
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._reset)
+    
+    def _reset(self) -> None:
+        self._prefix = secrets.token_hex(4)
+        self._counter = itertools.count()
+    
+    def next_id(self) -> str:
+        return f"{self.tag}-{self._prefix}-{next(self._counter)}"
@@ -2,6 +2,45 @@ from typing import Optional
 from src.core.claim import Claim, ClaimLabel
 
 
+# Number of unsupported claims listed individually in finalization reasons
+_UNSUPPORTED_SAMPLE_SIZE = 5
+
+# Fixed GC-13 reasons returned when nothing was extracted
+_ZERO_CLAIMS_REASONS = (
+    "No claims extracted - cannot finalize",
+    "Checklist:",
+    "  - Provide derivation steps with explicit claims",
+    "  - OR provide equations/identities to verify",
+    "  - OR provide source attributions/citations",
+    "  - OR explicitly state 'no derivation possible yet' with explanation",
+)
+
+
+def _tally_unsupported(
+    claims: list[Claim], sample_size: int = _UNSUPPORTED_SAMPLE_SIZE
+) -> tuple[int, int, list[Claim]]:
+    """
+    Single pass over claims.
+    
+    Returns:
+        (total_non_spec, unsupported_count, first unsupported claims up to
+        sample_size)
+    """
+    speculative = ClaimLabel.SPECULATIVE
+    total_non_spec = 0
+    unsupported = 0
+    sample = []
+    for c in claims:
+        if c.claim_label is speculative:
+            continue
+        total_non_spec += 1
+        if not c.is_supported():
+            unsupported += 1
+            if len(sample) < sample_size:
+                sample.append(c)
+    return (total_non_spec, unsupported, sample)
+
+
 def compute_unsupported_claim_rate(claims: list[Claim]) -> float:
     """
     Compute unsupported-claim rate per GC-6.
@@ -13,18 +52,12 @@ def compute_unsupported_claim_rate(claims: list[Claim]) -> float:
     GC-1's core is what counts as a claim (statement asserting a math/physics fact that could
     be wrong and would affect correctness).
     """
-    non_speculative_claims = [
-        c for c in claims if c.claim_label != ClaimLabel.SPECULATIVE
-    ]
+    total_non_spec, unsupported, _ = _tally_unsupported(claims, sample_size=0)
     
-    if len(non_speculative_claims) == 0:
+    if total_non_spec == 0:
         return 0.0
     
-    unsupported_claims = [
-        c for c in non_speculative_claims if not c.is_supported()
-    ]
-    
-    return len(unsupported_claims) / len(non_speculative_claims)
+    return unsupported / total_non_spec
 
 
 def finalization_check(claims: list[Claim]) -> tuple[bool, list[str]]:
@@ -41,42 +74,26 @@ def finalization_check(claims: list[Claim]) -> tuple[bool, list[str]]:
         - can_finalize: True only if all required artifacts present and valid
         - reasons: List of blocking reasons if cannot finalize
     """
-    reasons = []
-    
     if len(claims) == 0:
-        reasons.append("No claims extracted - cannot finalize")
-        reasons.append("Checklist:")
-        reasons.append("  - Provide derivation steps with explicit claims")
-        reasons.append("  - OR provide equations/identities to verify")
-        reasons.append("  - OR provide source attributions/citations")
-        reasons.append("  - OR explicitly state 'no derivation possible yet' with explanation")
-        return (False, reasons)
+        return (False, list(_ZERO_CLAIMS_REASONS))
     
-    non_speculative_claims = [
-        c for c in claims if c.claim_label != ClaimLabel.SPECULATIVE
-    ]
+    total_non_spec, unsupported, sample = _tally_unsupported(claims)
     
-    if len(non_speculative_claims) == 0:
+    if total_non_spec == 0:
         return (True, [])
     
-    unsupported_claims = [
-        c for c in non_speculative_claims if not c.is_supported()
-    ]
-    
-    if len(unsupported_claims) > 0:
-        reasons.append(
-            f"Found {len(unsupported_claims)} unsupported non-SPECULATIVE claim(s)"
-        )
-        reasons.append(
-            f"Unsupported claim rate: {len(unsupported_claims)}/{len(non_speculative_claims)} "
-            f"= {compute_unsupported_claim_rate(claims):.2%}"
-        )
+    if unsupported > 0:
+        reasons = [
+            f"Found {unsupported} unsupported non-SPECULATIVE claim(s)",
+            f"Unsupported claim rate: {unsupported}/{total_non_spec} "
+            f"= {unsupported / total_non_spec:.2%}",
+        ]
         
-        for claim in unsupported_claims[:5]:
+        for claim in sample:
             reasons.append(f"  - [{claim.claim_label.value}] {claim.statement[:80]}...")
         
-        if len(unsupported_claims) > 5:
-            reasons.append(f"  ... and {len(unsupported_claims) - 5} more")
+        if unsupported > _UNSUPPORTED_SAMPLE_SIZE:
+            reasons.append(f"  ... and {unsupported - _UNSUPPORTED_SAMPLE_SIZE} more")
         
         return (False, reasons)
     
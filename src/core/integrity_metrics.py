@@ -178,7 +178,7 @@ def compute_integrity_metrics(
             continue
         
         # Skip SPECULATIVE claims (not counted in GC-6)
-        if claim_label == ClaimLabel.SPECULATIVE:
+        if claim_label is ClaimLabel.SPECULATIVE:
             continue
         
         # Count non-SPECULATIVE claim
@@ -250,7 +250,7 @@ def compute_speculative_flood_warning(claims: list[Claim]) -> Optional[str]:
     if not claims or len(claims) == 0:
         return None
     
-    speculative_count = sum(1 for c in claims if c.claim_label == ClaimLabel.SPECULATIVE)
+    speculative_count = sum(1 for c in claims if c.claim_label is ClaimLabel.SPECULATIVE)
     total_claims = len(claims)
     speculative_ratio = speculative_count / total_claims
     
@@ -1,9 +1,33 @@
 import json
 import hashlib
-from datetime import datetime, timezone
+import time
+import weakref
 from pathlib import Path
-from typing import Optional
-from src.core.claim import Claim, ClaimDraft
+from typing import BinaryIO, Optional
+from src.core.claim import Claim, ClaimDraft, ClaimLabel
+
+def _json_dumps(obj) -> bytes:
+    # Same bytes as orjson: compact separators, non-ASCII left unescaped
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode('utf-8')
+
+
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        try:
+            return orjson.dumps(obj)
+        except orjson.JSONEncodeError:
+            # e.g. non-str keys or ints beyond 64 bits
+            return _json_dumps(obj)
+except ImportError:
+    _dumps = _json_dumps
+
+
+def _close_handles(handles: dict) -> None:
+    for handle in handles.values():
+        handle.close()
+    handles.clear()
 
 
 class ClaimLogger:
@@ -11,20 +35,51 @@ class ClaimLogger:
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
         self.log_file = self.log_dir / "claim_extraction.jsonl"
+        # Per-second cache of the formatted "YYYY-MM-DDTHH:MM:SS" prefix
+        self._ts_second = -1
+        self._ts_prefix = ""
+        # Append handles stay open across calls; opened lazily per log file
+        self._handles: dict[Path, BinaryIO] = {}
+        weakref.finalize(self, _close_handles, self._handles)
+
+    def close(self) -> None:
+        """Close open log handles; a later log call reopens them."""
+        _close_handles(self._handles)
+
+    def _append(self, path: Path, entry: dict) -> None:
+        handle = self._handles.get(path)
+        if handle is None:
+            handle = self._handles[path] = open(path, 'ab')
+        handle.write(_dumps(entry) + b'\n')
+        # Flush per entry so each line is on disk as soon as the call returns
+        handle.flush()
+
+    def _timestamp(self) -> str:
+        """UTC ISO-8601 timestamp with microseconds, e.g. 2024-01-01T00:00:00.000123+00:00"""
+        seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+        if seconds != self._ts_second:
+            self._ts_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+            self._ts_second = seconds
+        return f"{self._ts_prefix}.{nanos // 1000:06d}+00:00"
 
     def compute_input_hash(self, input_text: str) -> str:
-        return hashlib.sha256(input_text.encode('utf-8')).hexdigest()
+        return hashlib.sha256(
+            input_text.encode('utf-8'), usedforsecurity=False
+        ).hexdigest()
  
     def log_extraction(
         self,
         input_text: str,
         claims: list[ClaimDraft],
         run_id: Optional[str] = None,
+        input_hash: Optional[str] = None,
     ) -> str:
-        input_hash = self.compute_input_hash(input_text)
+        # Callers that already hashed input_text can pass the digest in
+        if input_hash is None:
+            input_hash = self.compute_input_hash(input_text)
         
         log_entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": self._timestamp(),
             "run_id": run_id,
             "input_hash": input_hash,
             "input_length": len(input_text),
@@ -39,8 +94,7 @@ class ClaimLogger:
             "claim_count": len(claims),
         }
         
-        with open(self.log_file, 'a') as f:
-            f.write(json.dumps(log_entry) + '\n')
+        self._append(self.log_file, log_entry)
         
         return input_hash
 
@@ -52,15 +106,13 @@ class ClaimLogger:
         run_id: Optional[str] = None,
     ) -> None:
         log_entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": self._timestamp(),
             "run_id": run_id,
             "event": "finalization_check",
             "can_finalize": can_finalize,
             "reasons": reasons,
             "total_claims": len(claims),
-            "non_speculative_claims": len([c for c in claims if c.claim_label.value != "SPECULATIVE"]),
+            "non_speculative_claims": sum(1 for c in claims if c.claim_label is not ClaimLabel.SPECULATIVE),
         }
         
-        finalization_log = self.log_dir / "finalization.jsonl"
-        with open(finalization_log, 'a') as f:
-            f.write(json.dumps(log_entry) + '\n')
+        self._append(self.log_dir / "finalization.jsonl", log_entry)
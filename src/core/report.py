@@ -4,6 +4,7 @@ GC-3/GC-4/GC-6/GC-7 ScientificReport Schema
 Container for claims, derivation steps, evidence, integrity metrics, and coverage metrics with structural validation.
 """
 
+from collections import Counter
 from dataclasses import dataclass, field
 from typing import Optional
 from src.core.claim import Claim
@@ -13,7 +14,12 @@ from src.core.integrity_metrics import IntegrityMetrics
 from src.core.coverage_metrics import CoverageMetrics
 
 
-@dataclass
+def _duplicates(ids) -> set:
+    """Return ids occurring more than once (single hash pass)."""
+    return {i for i, count in Counter(ids).items() if count > 1}
+
+
+@dataclass(slots=True)
 class ScientificReport:
     """
     GC-3/GC-4/GC-6/GC-7: Scientific report containing claims, steps, evidence, integrity metrics, and coverage metrics.
@@ -45,6 +51,10 @@ class ScientificReport:
     integrity_metrics: Optional[IntegrityMetrics] = None
     coverage_metrics: Optional[CoverageMetrics] = None
     integrity_warnings: list[str] = field(default_factory=list)
+    # (structure key, result) of GC-3 validation (see validate_report_structure use_cache)
+    _structure_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    # Lazily built claim_id -> owning step_id index (see get_owning_step)
+    _claim_owner_index: Optional[dict[str, str]] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         # Basic type validation
@@ -67,25 +77,46 @@ class ScientificReport:
             raise TypeError(f"coverage_metrics must be CoverageMetrics or None, got {type(self.coverage_metrics).__name__}")
         
         # Check for duplicate claim_ids in claims list
-        claim_ids = [c.claim_id for c in self.claims]
-        if len(claim_ids) != len(set(claim_ids)):
-            duplicates = [cid for cid in claim_ids if claim_ids.count(cid) > 1]
+        duplicates = _duplicates(c.claim_id for c in self.claims)
+        if duplicates:
             raise ValueError(
-                f"Duplicate claim_ids in claims list: {set(duplicates)} (GC-3: CLAIM_ID_COLLISION)"
+                f"Duplicate claim_ids in claims list: {duplicates} (GC-3: CLAIM_ID_COLLISION)"
             )
         
         # Check for duplicate step_ids in steps list
-        step_ids = [s.step_id for s in self.steps]
-        if len(step_ids) != len(set(step_ids)):
-            duplicates = [sid for sid in step_ids if step_ids.count(sid) > 1]
+        duplicates = _duplicates(s.step_id for s in self.steps)
+        if duplicates:
             raise ValueError(
-                f"Duplicate step_ids in steps list: {set(duplicates)} (GC-3: STEP_ID_COLLISION)"
+                f"Duplicate step_ids in steps list: {duplicates} (GC-3: STEP_ID_COLLISION)"
             )
         
         # GC-4: Check for duplicate evidence_ids in evidence list
-        evidence_ids = [e.evidence_id for e in self.evidence]
-        if len(evidence_ids) != len(set(evidence_ids)):
-            duplicates = [eid for eid in evidence_ids if evidence_ids.count(eid) > 1]
+        duplicates = _duplicates(e.evidence_id for e in self.evidence)
+        if duplicates:
             raise ValueError(
-                f"Duplicate evidence_ids in evidence list: {set(duplicates)} (GC-4: EVIDENCE_ID_COLLISION)"
+                f"Duplicate evidence_ids in evidence list: {duplicates} (GC-4: EVIDENCE_ID_COLLISION)"
             )
+    
+    def get_owning_step(self, claim_id: str) -> Optional[str]:
+        """
+        GC-3: step_id of the step that owns claim_id, or None if unreferenced.
+        
+        The claim_id -> step_id index is built on the first call and reused;
+        if a claim is (invalidly) owned by several steps, the first one wins.
+        Treat steps as immutable once this has been called: the index is not
+        rebuilt on its own, so callers that mutate steps afterwards must call
+        invalidate_caches() first.
+        """
+        index = self._claim_owner_index
+        if index is None:
+            index = {}
+            for step in self.steps:
+                for cid in step.claim_ids:
+                    index.setdefault(cid, step.step_id)
+            self._claim_owner_index = index
+        return index.get(claim_id)
+    
+    def invalidate_caches(self) -> None:
+        """Drop the get_owning_step index and cached GC-3 validation result."""
+        self._claim_owner_index = None
+        self._structure_cache = None
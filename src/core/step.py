@@ -4,10 +4,16 @@ GC-3 Step/Claim Boundary Schema
 Defines DerivationStep and ScientificReport schemas with strict structural validation.
 """
 
+from collections import Counter
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional
-from uuid import uuid4
+from src.core.id_parsers import _INVISIBLE_CHARS
+from src.core.id_source import IdSource
+
+
+# Generated step IDs follow the Claim.create scheme (see IdSource).
+_next_step_id = IdSource("s").next_id
 
 
 class StepStatus(Enum):
@@ -25,7 +31,7 @@ class StepStatus(Enum):
     INDETERMINATE = "indeterminate"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DerivationStep:
     """
     GC-3/GC-8: Derivation step linking to claims.
@@ -60,8 +66,7 @@ class DerivationStep:
         trimmed_statement = self.statement.strip()
         # Check for invisible-only content after ASCII whitespace trim
         if trimmed_statement:
-            invisible_chars = {'\u200b', '\u00a0', '\ufeff', '\u2060', '\u200c', '\u200d'}
-            if all(c in invisible_chars for c in trimmed_statement):
+            if _INVISIBLE_CHARS.issuperset(trimmed_statement):
                 trimmed_statement = ""
         if not trimmed_statement:
             raise ValueError(f"Step {self.step_id}: statement is empty, whitespace-only, or invisible-only (GC-8: DERIVATION_STEP_EMPTY_STATEMENT)")
@@ -75,10 +80,11 @@ class DerivationStep:
             raise TypeError(f"Step {self.step_id}: claim_ids must be a list, got {type(self.claim_ids).__name__}")
         
         # Check for duplicate claim_ids within this step
-        if len(self.claim_ids) != len(set(self.claim_ids)):
-            duplicates = [cid for cid in self.claim_ids if self.claim_ids.count(cid) > 1]
+        claim_id_counts = Counter(self.claim_ids)
+        if len(claim_id_counts) != len(self.claim_ids):
+            duplicates = {cid for cid, count in claim_id_counts.items() if count > 1}
             raise ValueError(
-                f"Step {self.step_id}: duplicate claim_ids within step: {set(duplicates)} "
+                f"Step {self.step_id}: duplicate claim_ids within step: {duplicates} "
                 f"(GC-3: DUPLICATE_CLAIM_IN_STEP)"
             )
         
@@ -100,8 +106,7 @@ class DerivationStep:
             trimmed = self.status_reason.strip()
             # Check for invisible-only content after ASCII whitespace trim
             if trimmed:
-                invisible_chars = {'\u200b', '\u00a0', '\ufeff', '\u2060', '\u200c', '\u200d'}
-                if all(c in invisible_chars for c in trimmed):
+                if _INVISIBLE_CHARS.issuperset(trimmed):
                     trimmed = ""
             if not trimmed:
                 raise ValueError(
@@ -114,8 +119,7 @@ class DerivationStep:
             trimmed = self.status_reason.strip()
             # Check for invisible-only content after ASCII whitespace trim
             if trimmed:
-                invisible_chars = {'\u200b', '\u00a0', '\ufeff', '\u2060', '\u200c', '\u200d'}
-                if all(c in invisible_chars for c in trimmed):
+                if _INVISIBLE_CHARS.issuperset(trimmed):
                     trimmed = ""
             if not trimmed:
                 raise ValueError(
@@ -135,6 +139,32 @@ class DerivationStep:
                 f"Step {self.step_id}: depends_on must be a list, got {type(self.depends_on).__name__}"
             )
     
+    @classmethod
+    def _unchecked(
+        cls,
+        step_id: str,
+        claim_ids: list[str],
+        statement: str,
+        step_status: StepStatus = StepStatus.UNCHECKED,
+        depends_on: Optional[list[str]] = None,
+        status_reason: Optional[str] = None,
+    ) -> "DerivationStep":
+        """
+        Build a step WITHOUT running __post_init__ validation.
+        
+        Skips every GC-3/GC-7/GC-8 construction check (statement, non-empty and
+        duplicate claim_ids, step_status type, status_reason rules). Only for
+        trusted loaders whose input has already been validated in bulk.
+        """
+        step = cls.__new__(cls)
+        object.__setattr__(step, "step_id", step_id)
+        object.__setattr__(step, "claim_ids", claim_ids)
+        object.__setattr__(step, "statement", statement)
+        object.__setattr__(step, "step_status", step_status)
+        object.__setattr__(step, "depends_on", [] if depends_on is None else depends_on)
+        object.__setattr__(step, "status_reason", status_reason)
+        return step
+    
     @staticmethod
     def create(
         claim_ids: list[str],
@@ -145,7 +175,7 @@ class DerivationStep:
     ) -> "DerivationStep":
         """Create a new DerivationStep with generated step_id."""
         return DerivationStep(
-            step_id=str(uuid4()),
+            step_id=_next_step_id(),
             claim_ids=claim_ids,
             statement=statement,
             step_status=step_status,
@@ -17,11 +17,11 @@ Additional strict rules:
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterator, Optional
 from src.core.report import ScientificReport
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ValidationError:
     """
     Structured validation error with deterministic reporting.
@@ -54,56 +54,99 @@ class StructureValidator:
     """
     
     @staticmethod
-    def validate_report(report: ScientificReport) -> tuple[bool, list[ValidationError]]:
+    def validate_report(
+        report: ScientificReport, *, fail_fast: bool = False
+    ) -> tuple[bool, list[ValidationError]]:
         """
         Validate complete report structure.
         
+        Args:
+            report: Report to validate
+            fail_fast: Stop at the first error; errors then holds at most one
+                entry (the same one a full validation would report first)
+        
         Returns:
             (is_valid, errors) where is_valid is True if no errors, False otherwise
         """
-        errors: list[ValidationError] = []
-        
-        # V1: Referenced claim IDs must exist
-        errors.extend(StructureValidator._validate_claim_references(report))
-        
-        # V2: No orphan claims
-        errors.extend(StructureValidator._validate_no_orphans(report))
-        
-        # V3: Unique claim ownership
-        errors.extend(StructureValidator._validate_unique_ownership(report))
-        
-        # V4: Step claim_ids non-empty (enforced in DerivationStep.__post_init__)
-        # This is already checked at construction time
-        
-        # Additional: Validate depends_on references
-        errors.extend(StructureValidator._validate_step_dependencies(report))
-        
+        error_iter = StructureValidator._iter_errors(report)
+        if fail_fast:
+            first = next(error_iter, None)
+            errors = [] if first is None else [first]
+        else:
+            errors = list(error_iter)
         return (len(errors) == 0, errors)
     
     @staticmethod
-    def _validate_claim_references(report: ScientificReport) -> list[ValidationError]:
+    def _iter_errors(report: ScientificReport) -> Iterator[ValidationError]:
         """
-        V1: Validate that all referenced claim_ids exist.
+        Fused V1 + V2 + V3 + depends_on validation, yielded lazily.
         
-        For every step.claim_ids[i], there must exist a claim with that claim_id.
-        """
-        errors: list[ValidationError] = []
+        Walks report.steps once (plus report.claims twice) instead of once per
+        rule. Errors are grouped by rule in V1, V2, V3, depends_on order; the
+        per-rule _validate_* helpers filter this pass by category.
         
-        # Build set of existing claim_ids
+        V4 (step claim_ids non-empty) is enforced in DerivationStep.__post_init__.
+        """
         existing_claim_ids = {claim.claim_id for claim in report.claims}
+        existing_step_ids: set[str] = set()
+        first_owner: dict[str, str] = {}  # claim_id -> first owning step_id
+        conflicts: dict[str, list[str]] = {}  # claim_id -> [step_ids], only if >1
+        step_deps: list[tuple[str, list[str]]] = []
         
-        # Check each step's claim_ids
+        # V1: Referenced claim IDs must exist (checked while recording ownership)
         for step in report.steps:
+            step_id = step.step_id
+            existing_step_ids.add(step_id)
+            if step.depends_on:
+                step_deps.append((step_id, step.depends_on))
             for claim_id in step.claim_ids:
+                StructureValidator._record_owner(first_owner, conflicts, claim_id, step_id)
                 if claim_id not in existing_claim_ids:
-                    errors.append(ValidationError(
+                    yield ValidationError(
                         category="DANGLING_CLAIM_ID",
                         message=f"Step references non-existent claim_id: {claim_id}",
-                        step_id=step.step_id,
+                        step_id=step_id,
                         claim_id=claim_id,
-                    ))
+                    )
         
-        return errors
+        # V2: No orphan claims
+        for claim in report.claims:
+            if claim.claim_id not in first_owner:
+                yield ValidationError(
+                    category="ORPHAN_CLAIM",
+                    message=f"Claim is not referenced by any step: {claim.claim_id}",
+                    claim_id=claim.claim_id,
+                )
+        
+        # V3: Unique claim ownership
+        yield from StructureValidator._duplicate_owner_errors(first_owner, conflicts)
+        
+        # Additional: Validate depends_on references
+        for step_id, depends_on in step_deps:
+            for dep_step_id in depends_on:
+                if dep_step_id not in existing_step_ids:
+                    yield ValidationError(
+                        category="DANGLING_STEP_DEP",
+                        message=f"Step depends on non-existent step_id: {dep_step_id}",
+                        step_id=step_id,
+                    )
+    
+    @staticmethod
+    def _errors_in_category(report: ScientificReport, category: str) -> list[ValidationError]:
+        """Errors of one category from the fused pass, in the order it reports them."""
+        return [
+            error for error in StructureValidator._iter_errors(report)
+            if error.category == category
+        ]
+    
+    @staticmethod
+    def _validate_claim_references(report: ScientificReport) -> list[ValidationError]:
+        """
+        V1: Validate that all referenced claim_ids exist.
+        
+        For every step.claim_ids[i], there must exist a claim with that claim_id.
+        """
+        return StructureValidator._errors_in_category(report, "DANGLING_CLAIM_ID")
     
     @staticmethod
     def _validate_no_orphans(report: ScientificReport) -> list[ValidationError]:
@@ -113,23 +156,7 @@ class StructureValidator:
         Every claim.claim_id must appear in exactly one step.claim_ids.
         If a claim appears in zero steps, it's an orphan.
         """
-        errors: list[ValidationError] = []
-        
-        # Build set of all referenced claim_ids
-        referenced_claim_ids = set()
-        for step in report.steps:
-            referenced_claim_ids.update(step.claim_ids)
-        
-        # Check each claim is referenced
-        for claim in report.claims:
-            if claim.claim_id not in referenced_claim_ids:
-                errors.append(ValidationError(
-                    category="ORPHAN_CLAIM",
-                    message=f"Claim is not referenced by any step: {claim.claim_id}",
-                    claim_id=claim.claim_id,
-                ))
-        
-        return errors
+        return StructureValidator._errors_in_category(report, "ORPHAN_CLAIM")
     
     @staticmethod
     def _validate_unique_ownership(report: ScientificReport) -> list[ValidationError]:
@@ -138,27 +165,7 @@ class StructureValidator:
         
         A claim_id may not appear in multiple steps.
         """
-        errors: list[ValidationError] = []
-        
-        # Track which step owns each claim_id
-        claim_ownership: dict[str, list[str]] = {}  # claim_id -> [step_ids]
-        
-        for step in report.steps:
-            for claim_id in step.claim_ids:
-                if claim_id not in claim_ownership:
-                    claim_ownership[claim_id] = []
-                claim_ownership[claim_id].append(step.step_id)
-        
-        # Check for duplicate ownership
-        for claim_id, owner_step_ids in claim_ownership.items():
-            if len(owner_step_ids) > 1:
-                errors.append(ValidationError(
-                    category="DUPLICATE_CLAIM_OWNER",
-                    message=f"Claim is owned by multiple steps: {owner_step_ids}",
-                    claim_id=claim_id,
-                ))
-        
-        return errors
+        return StructureValidator._errors_in_category(report, "DUPLICATE_CLAIM_OWNER")
     
     @staticmethod
     def _validate_step_dependencies(report: ScientificReport) -> list[ValidationError]:
@@ -167,29 +174,89 @@ class StructureValidator:
         
         If a step has depends_on, all referenced step_ids must exist.
         """
-        errors: list[ValidationError] = []
-        
-        # Build set of existing step_ids
-        existing_step_ids = {step.step_id for step in report.steps}
-        
-        # Check each step's depends_on
-        for step in report.steps:
-            for dep_step_id in step.depends_on:
-                if dep_step_id not in existing_step_ids:
-                    errors.append(ValidationError(
-                        category="DANGLING_STEP_DEP",
-                        message=f"Step depends on non-existent step_id: {dep_step_id}",
-                        step_id=step.step_id,
-                    ))
+        return StructureValidator._errors_in_category(report, "DANGLING_STEP_DEP")
+    
+    @staticmethod
+    def _record_owner(
+        first_owner: dict[str, str],
+        conflicts: dict[str, list[str]],
+        claim_id: str,
+        step_id: str,
+    ) -> None:
+        """
+        Record that step_id owns claim_id.
         
-        return errors
+        Single-owner claims only touch first_owner; an owner list is allocated
+        the first time a claim is seen in a second step.
+        """
+        prev = first_owner.get(claim_id)
+        if prev is None:
+            first_owner[claim_id] = step_id
+        else:
+            owners = conflicts.get(claim_id)
+            if owners is None:
+                conflicts[claim_id] = [prev, step_id]
+            else:
+                owners.append(step_id)
+    
+    @staticmethod
+    def _duplicate_owner_errors(
+        first_owner: dict[str, str],
+        conflicts: dict[str, list[str]],
+    ) -> list[ValidationError]:
+        """DUPLICATE_CLAIM_OWNER errors, ordered by each claim_id's first reference."""
+        if not conflicts:
+            return []
+        return [
+            ValidationError(
+                category="DUPLICATE_CLAIM_OWNER",
+                message=f"Claim is owned by multiple steps: {conflicts[claim_id]}",
+                claim_id=claim_id,
+            )
+            for claim_id in first_owner
+            if claim_id in conflicts
+        ]
+
+
+def _structure_key(report: ScientificReport) -> tuple:
+    """Snapshot of every report field the GC-3 structure pass reads."""
+    return (
+        tuple([claim.claim_id for claim in report.claims]),
+        tuple([
+            (step.step_id, tuple(step.claim_ids), tuple(step.depends_on))
+            for step in report.steps
+        ]),
+    )
 
 
-def validate_report_structure(report: ScientificReport) -> tuple[bool, list[ValidationError]]:
+def validate_report_structure(
+    report: ScientificReport, *, fail_fast: bool = False, use_cache: bool = False
+) -> tuple[bool, list[ValidationError]]:
     """
     Convenience function for validating report structure.
     
+    use_cache=True stores the full result on the report, keyed on a snapshot
+    of the claim ids and step ids/claim_ids/depends_on it was computed from,
+    for pipelines that validate the same report at several stages. A later
+    use_cache call reuses it only if that snapshot is unchanged, so mutating
+    claims or steps can never return a stale pass.
+    
     Returns:
         (is_valid, errors) where is_valid is True if no errors, False otherwise
     """
-    return StructureValidator.validate_report(report)
+    if not use_cache:
+        return StructureValidator.validate_report(report, fail_fast=fail_fast)
+    
+    key = _structure_key(report)
+    cached = report._structure_cache
+    if cached is None or cached[0] != key:
+        cached = (key, StructureValidator.validate_report(report))
+        report._structure_cache = cached
+    is_valid, errors = cached[1]
+    # Hand out copies so callers cannot alter the cached list
+    return (is_valid, errors[:1] if fail_fast else list(errors))
+
+
+def invalidate_structure_cache(report: ScientificReport) -> None:
+    """Drop cached validate_report_structure / get_owning_step data from the report."""
+    report.invalidate_caches()
@@ -11,6 +11,17 @@ Strict validation for claim labels per GC-2:
 
 from typing import Any
 from src.core.claim import ClaimLabel
+from src.core.id_parsers import _INVISIBLE_CHARS, _wire_repr
+
+
+_VALID_LABELS = frozenset(("DERIVED", "COMPUTED", "CITED", "SPECULATIVE"))
+_LABEL_MEMBERS = dict(ClaimLabel.__members__)
+
+# Non-string wire types -> name used in the GC-2 TypeError message
+_REJECTED_TYPE_NAMES = {bool: "bool", int: "number", float: "number", list: "list", dict: "dict"}
+
+# Distinguishes a missing key from an explicit null in a single dict probe
+_MISSING = object()
 
 
 def parse_claim_label(wire: Any) -> ClaimLabel:
@@ -38,86 +49,79 @@ def parse_claim_label(wire: Any) -> ClaimLabel:
         TypeError: If input is not a string
         ValueError: If string is not a valid label (exact ASCII match)
     """
+    # Hot path: an exact valid label costs one type check and one set probe.
+    # The type check keeps unhashable wire values (list/dict) out of the probe.
+    if type(wire) is str and wire in _VALID_LABELS:
+        return _LABEL_MEMBERS[wire]
+    
     if wire is None:
         raise ValueError("Invalid ClaimLabel: None (GC-2)")
     
+    # Exact JSON types resolve with one dict lookup; subclasses (e.g. IntEnum)
+    # fall through to the isinstance checks below
+    type_name = _REJECTED_TYPE_NAMES.get(type(wire))
+    if type_name is not None:
+        raise TypeError(f"Invalid ClaimLabel: {_wire_repr(wire)} (expected string, got {type_name}) (GC-2)")
+    
     if isinstance(wire, bool):
-        raise TypeError(f"Invalid ClaimLabel: {repr(wire)} (expected string, got bool) (GC-2)")
+        raise TypeError(f"Invalid ClaimLabel: {_wire_repr(wire)} (expected string, got bool) (GC-2)")
     
     if isinstance(wire, (int, float)):
-        raise TypeError(f"Invalid ClaimLabel: {repr(wire)} (expected string, got number) (GC-2)")
+        raise TypeError(f"Invalid ClaimLabel: {_wire_repr(wire)} (expected string, got number) (GC-2)")
     
     if isinstance(wire, list):
-        raise TypeError(f"Invalid ClaimLabel: {repr(wire)} (expected string, got list) (GC-2)")
+        raise TypeError(f"Invalid ClaimLabel: {_wire_repr(wire)} (expected string, got list) (GC-2)")
     
     if isinstance(wire, dict):
-        raise TypeError(f"Invalid ClaimLabel: {repr(wire)} (expected string, got dict) (GC-2)")
+        raise TypeError(f"Invalid ClaimLabel: {_wire_repr(wire)} (expected string, got dict) (GC-2)")
     
     if not isinstance(wire, str):
         raise TypeError(
-            f"Invalid ClaimLabel: {repr(wire)} (expected string, got {type(wire).__name__}) (GC-2)"
+            f"Invalid ClaimLabel: {_wire_repr(wire)} (expected string, got {type(wire).__name__}) (GC-2)"
         )
     
     if wire == "":
         raise ValueError("Invalid ClaimLabel: empty string (GC-2)")
     
-    # Check for exact ASCII match (no unicode, no invisibles)
-    valid_labels = {"DERIVED", "COMPUTED", "CITED", "SPECULATIVE"}
-    
-    # First check: exact match (fast path)
-    if wire in valid_labels:
-        # Additional safety: ensure it's pure ASCII
-        try:
-            wire.encode('ascii')
-        except UnicodeEncodeError:
-            raise ValueError(
-                f"Invalid ClaimLabel: {repr(wire)} contains non-ASCII characters (GC-2)"
-            )
-        return ClaimLabel[wire]
+    # Exact match for str subclasses. Every valid label is ASCII, so an
+    # exact match needs no further encoding check.
+    if wire in _VALID_LABELS:
+        return _LABEL_MEMBERS[wire]
     
     # Rejection path: provide specific error messages
     # Order matters: check unicode invisibles BEFORE whitespace, since NBSP is both
     
+    # Every invisible is non-ASCII; isascii() reads a flag on the str object,
+    # so ASCII rejects skip the invisible scan and the non-ASCII check below
+    ascii_only = wire.isascii()
+    
     # Check for unicode invisibles (ZWSP, NBSP, etc.)
-    # Common invisibles: U+200B (ZWSP), U+00A0 (NBSP), U+FEFF (BOM), U+2060 (WJ)
-    invisible_chars = [
-        '\u200b',  # ZWSP
-        '\u00a0',  # NBSP
-        '\ufeff',  # BOM
-        '\u2060',  # Word Joiner
-        '\u200c',  # ZWNJ
-        '\u200d',  # ZWJ
-    ]
-    
-    for invisible in invisible_chars:
-        if invisible in wire:
-            raise ValueError(
-                f"Invalid ClaimLabel: {repr(wire)} contains invisible unicode character (GC-2)"
-            )
+    if not ascii_only and not _INVISIBLE_CHARS.isdisjoint(wire):
+        raise ValueError(
+            f"Invalid ClaimLabel: {_wire_repr(wire)} contains invisible unicode character (GC-2)"
+        )
     
     # Check for whitespace variants (regular ASCII whitespace)
-    if wire.strip() in valid_labels:
+    if wire.strip() in _VALID_LABELS:
         raise ValueError(
-            f"Invalid ClaimLabel: {repr(wire)} has invalid whitespace (GC-2)"
+            f"Invalid ClaimLabel: {_wire_repr(wire)} has invalid whitespace (GC-2)"
         )
     
     # Check for case variants
-    if wire.upper() in valid_labels:
+    if wire.upper() in _VALID_LABELS:
         raise ValueError(
-            f"Invalid ClaimLabel: {repr(wire)} must be uppercase (expected {wire.upper()}) (GC-2)"
+            f"Invalid ClaimLabel: {_wire_repr(wire)} must be uppercase (expected {wire.upper()}) (GC-2)"
         )
     
     # Check for non-ASCII (catches unicode confusables)
-    try:
-        wire.encode('ascii')
-    except UnicodeEncodeError:
+    if not ascii_only:
         raise ValueError(
-            f"Invalid ClaimLabel: {repr(wire)} contains non-ASCII characters (GC-2)"
+            f"Invalid ClaimLabel: {_wire_repr(wire)} contains non-ASCII characters (GC-2)"
         )
     
     # Generic invalid label
     raise ValueError(
-        f"Invalid ClaimLabel: {repr(wire)} (must be one of: DERIVED, COMPUTED, CITED, SPECULATIVE) (GC-2)"
+        f"Invalid ClaimLabel: {_wire_repr(wire)} (must be one of: DERIVED, COMPUTED, CITED, SPECULATIVE) (GC-2)"
     )
 
 
@@ -158,9 +162,9 @@ def validate_claim_label_string(label_str: Any) -> ClaimLabel:
     if label_str == "":
         raise ValueError("Claim label cannot be empty string (GC-2)")
     
-    valid_labels = {"DERIVED", "COMPUTED", "CITED", "SPECULATIVE"}
-    
-    if label_str not in valid_labels:
+    if label_str not in _VALID_LABELS:
+        # Error messages show the labels as a plain set, as before
+        valid_labels = set(_VALID_LABELS)
         if label_str.strip() in valid_labels:
             raise ValueError(
                 f"Claim label has invalid whitespace: '{label_str}'. "
@@ -178,7 +182,7 @@ def validate_claim_label_string(label_str: Any) -> ClaimLabel:
             f"Must be one of: {valid_labels} (GC-2)"
         )
     
-    return ClaimLabel[label_str]
+    return _LABEL_MEMBERS[label_str]
 
 
 def validate_claim_label_from_dict(data: dict) -> ClaimLabel:
@@ -197,7 +201,8 @@ def validate_claim_label_from_dict(data: dict) -> ClaimLabel:
         KeyError: If 'claim_label' key missing
         TypeError/ValueError: If label value invalid
     """
-    if "claim_label" not in data:
+    wire = data.get("claim_label", _MISSING)
+    if wire is _MISSING:
         raise KeyError("Missing required field 'claim_label' (GC-2)")
     
-    return parse_claim_label(data["claim_label"])
+    return parse_claim_label(wire)
@@ -0,0 +1,22 @@
+import json
+from functools import lru_cache
+from pathlib import Path
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@lru_cache(maxsize=None)
+def load_fixture(name: str) -> dict:
+    # Parsed once per process and shared; callers must not mutate the result
+    raw = (FIXTURES_DIR / name).read_bytes()
+    try:
+        return _loads(raw)
+    except ValueError:
+        # orjson rejects the NaN/Infinity literals that stdlib json accepts
+        return json.loads(raw)
@@ -0,0 +1,47 @@
+import pytest
+from src.core.claim import Claim, ClaimLabel
+from tests._fixture_cache import load_fixture
+
+
+@pytest.fixture(scope="session")
+def report_incomplete_valid():
+    return load_fixture("report_incomplete_valid.json")
+
+
+@pytest.fixture(scope="session")
+def report_invalid_whitespace_statement():
+    return load_fixture("report_invalid_whitespace_statement.json")
+
+
+@pytest.fixture(scope="session")
+def report_zero_claims():
+    return load_fixture("report_zero_claims.json")
+
+
+# Integrity checks only read claims, so these lists are shared read-only;
+# tests that assign evidence_ids build their own claims
+@pytest.fixture(scope="module")
+def speculative_claims():
+    return [
+        Claim.create("claim 1", ClaimLabel.SPECULATIVE),
+        Claim.create("claim 2", ClaimLabel.SPECULATIVE),
+    ]
+
+
+@pytest.fixture(scope="module")
+def unsupported_claims():
+    return [
+        Claim.create("claim 1", ClaimLabel.DERIVED),
+        Claim.create("claim 2", ClaimLabel.COMPUTED),
+    ]
+
+
+@pytest.fixture(scope="module")
+def supported_claims():
+    claims = [
+        Claim.create("claim 1", ClaimLabel.DERIVED),
+        Claim.create("claim 2", ClaimLabel.COMPUTED),
+    ]
+    claims[0].evidence_ids = ["evidence_1"]
+    claims[1].evidence_ids = ["evidence_2"]
+    return claims
@@ -1,275 +1,181 @@
 import pytest
-from src.core.claim_extractor import ClaimExtractor, extract_claims
+from src.core.claim_extractor import ClaimExtractor, extract_claims, extract_claims_batch
 from src.core.claim import ClaimLabel
 
 
+@pytest.fixture(scope="module")
+def extractor():
+    # ClaimExtractor holds only compiled patterns, so tests can share one
+    return ClaimExtractor()
+
+
+# (text, expected label of the first claim or None, substring of some claim or None)
+POSITIVE_TEXT_CASES = [
+    pytest.param("The energy is $E = mc^2$.", None, "E = mc^2", id="simple_equation"),
+    pytest.param("The velocity is equal to distance divided by time.", None, "velocity", id="assertion_with_equals"),
+    pytest.param("The Pythagorean theorem states that a^2 + b^2 = c^2.", None, "theorem", id="theorem_statement"),
+    pytest.param("Therefore, the momentum is conserved.", ClaimLabel.DERIVED, None, id="implication"),
+    pytest.param("According to Einstein, energy and mass are equivalent.", ClaimLabel.CITED, None, id="cited_claim"),
+    pytest.param("We compute the integral to be 42.", ClaimLabel.COMPUTED, None, id="computed_claim"),
+    pytest.param("Thus, the force equals mass times acceleration.", ClaimLabel.DERIVED, None, id="derived_claim"),
+    pytest.param("The function satisfies the differential equation.", None, None, id="satisfies_relation"),
+    pytest.param("This yields a value of 3.14.", None, None, id="yields_statement"),
+    pytest.param("The energy is greater than zero.", None, None, id="inequality"),
+    pytest.param("The force is proportional to the acceleration.", None, None, id="proportionality"),
+    pytest.param("Lemma 1 states that the sum converges.", ClaimLabel.CITED, None, id="lemma_statement"),
+    pytest.param("The equation becomes x = 5 after simplification.", None, None, id="becomes_statement"),
+    pytest.param("The particle obeys Newton's second law.", None, None, id="obeys_law"),
+    pytest.param("It follows that the velocity is constant.", None, None, id="follows_from"),
+    pytest.param("This gives us the final answer of 42.", None, None, id="gives_result"),
+    pytest.param("Proposition 3 shows that the limit exists.", None, None, id="proposition"),
+    pytest.param("Corollary 2 implies that the function is continuous.", None, None, id="corollary"),
+    pytest.param("The numerical simulation shows that x = 7.5.", ClaimLabel.COMPUTED, None, id="numerical_result"),
+    pytest.param("Hence, the system is stable.", ClaimLabel.DERIVED, None, id="hence_statement"),
+    pytest.param("From Ref. [5], we know that the constant is 2.718.", ClaimLabel.CITED, None, id="from_reference"),
+]
+
+# (latex block, exact claim count, expected label of the first claim or None, substring of the first claim or None)
+POSITIVE_LATEX_CASES = [
+    pytest.param(r"$$F = ma$$", 1, ClaimLabel.DERIVED, "F = ma", id="display_equation"),
+    pytest.param(r"\begin{equation}x^2 + y^2 = r^2\end{equation}", 1, None, "x^2 + y^2 = r^2", id="equation_environment"),
+    pytest.param(r"$$E = mc^2$$ and $$p = mv$$", 2, None, None, id="multiple_equations"),
+    pytest.param(r"\begin{align}x &= 1 \\ y &= 2\end{align}", 1, None, None, id="align_environment"),
+    pytest.param(r"\[E = \hbar\omega\]", 1, None, None, id="bracket_equation"),
+    pytest.param(r"$ z $$y=2$$", 1, None, "$$y=2$$", id="rejected_inline_keeps_display_delimiter"),
+]
+
+
 class TestClaimExtractorPositive:
     
-    def test_extract_simple_equation(self):
-        text = "The energy is $E = mc^2$."
-        extractor = ClaimExtractor()
-        claims = extractor.extract_claims(text)
-        assert len(claims) >= 1
-        assert any("E = mc^2" in c.statement for c in claims)
-    
-    def test_extract_display_equation(self):
-        latex = r"$$F = ma$$"
-        extractor = ClaimExtractor()
-        claims = extractor.extract_claims("", latex_blocks=[latex])
-        assert len(claims) == 1
-        assert "F = ma" in claims[0].statement
-        assert claims[0].suggested_label == ClaimLabel.DERIVED
-    
-    def test_extract_equation_environment(self):
-        latex = r"\begin{equation}x^2 + y^2 = r^2\end{equation}"
-        extractor = ClaimExtractor()
-        claims = extractor.extract_claims("", latex_blocks=[latex])
-        assert len(claims) == 1
-        assert "x^2 + y^2 = r^2" in claims[0].statement
-    
-    def test_extract_assertion_with_equals(self):
-        text = "The velocity is equal to distance divided by time."
-        extractor = ClaimExtractor()
-        claims = extractor.extract_claims(text)
-        assert len(claims) >= 1
-        assert any("velocity" in c.statement.lower() for c in claims)
-    
-    def test_extract_theorem_statement(self):
-        text = "The Pythagorean theorem states that a^2 + b^2 = c^2."
-        extractor = ClaimExtractor()
-        claims = extractor.extract_claims(text)
-        assert len(claims) >= 1
-        claim_statements = [c.statement for c in claims]
-        assert any("theorem" in ct.lower() for ct in claim_statements)
-    
-    def test_extract_implication(self):
-        text = "Therefore, the momentum is conserved."
-        extractor = ClaimExtractor()
-        claims = extractor.extract_claims(text)
-        assert len(claims) >= 1
-        assert claims[0].suggested_label == ClaimLabel.DERIVED
-    
-    def test_extract_multiple_equations(self):
-        latex = r"$$E = mc^2$$ and $$p = mv$$"
-        extractor = ClaimExtractor()
-        claims = extractor.extract_claims("", latex_blocks=[latex])
-        assert len(claims) == 2
-    
-    def test_extract_cited_claim(self):
-        text = "According to Einstein, energy and mass are equivalent."
-        extractor = ClaimExtractor()
-        claims = extractor.extract_claims(text)
-        assert len(claims) >= 1
-        assert claims[0].suggested_label == ClaimLabel.CITED
-    
-    def test_extract_computed_claim(self):
-        text = "We compute the integral to be 42."
-        extractor = ClaimExtractor()
-        claims = extractor.extract_claims(text)
-        assert len(claims) >= 1
-        assert claims[0].suggested_label == ClaimLabel.COMPUTED
-    
-    def test_extract_derived_claim(self):
-        text = "Thus, the force equals mass times acceleration."
-        extractor = ClaimExtractor()
+    @pytest.mark.parametrize("text, label, needle", POSITIVE_TEXT_CASES)
+    def test_extract_from_text(self, extractor, text, label, needle):
         claims = extractor.extract_claims(text)
         assert len(claims) >= 1
-        assert claims[0].suggested_label == ClaimLabel.DERIVED
+        if label is not None:
+            assert claims[0].suggested_label == label
+        if needle is not None:
+            assert any(needle in c.statement for c in claims)
     
-    def test_extract_satisfies_relation(self):
-        text = "The function satisfies the differential equation."
-        extractor = ClaimExtractor()
-        claims = extractor.extract_claims(text)
-        assert len(claims) >= 1
-    
-    def test_extract_yields_statement(self):
-        text = "This yields a value of 3.14."
-        extractor = ClaimExtractor()
-        claims = extractor.extract_claims(text)
-        assert len(claims) >= 1
-    
-    def test_extract_inequality(self):
-        text = "The energy is greater than zero."
-        extractor = ClaimExtractor()
-        claims = extractor.extract_claims(text)
-        assert len(claims) >= 1
-    
-    def test_extract_proportionality(self):
-        text = "The force is proportional to the acceleration."
-        extractor = ClaimExtractor()
-        claims = extractor.extract_claims(text)
-        assert len(claims) >= 1
-    
-    def test_extract_lemma_statement(self):
-        text = "Lemma 1 states that the sum converges."
-        extractor = ClaimExtractor()
-        claims = extractor.extract_claims(text)
-        assert len(claims) >= 1
-        assert claims[0].suggested_label == ClaimLabel.CITED
-    
-    def test_extract_becomes_statement(self):
-        text = "The equation becomes x = 5 after simplification."
-        extractor = ClaimExtractor()
-        claims = extractor.extract_claims(text)
-        assert len(claims) >= 1
-    
-    def test_extract_obeys_law(self):
-        text = "The particle obeys Newton's second law."
-        extractor = ClaimExtractor()
-        claims = extractor.extract_claims(text)
-        assert len(claims) >= 1
-    
-    def test_extract_follows_from(self):
-        text = "It follows that the velocity is constant."
-        extractor = ClaimExtractor()
-        claims = extractor.extract_claims(text)
-        assert len(claims) >= 1
-    
-    def test_extract_gives_result(self):
-        text = "This gives us the final answer of 42."
-        extractor = ClaimExtractor()
-        claims = extractor.extract_claims(text)
-        assert len(claims) >= 1
-    
-    def test_extract_align_environment(self):
-        latex = r"\begin{align}x &= 1 \\ y &= 2\end{align}"
-        extractor = ClaimExtractor()
+    @pytest.mark.parametrize("latex, count, label, needle", POSITIVE_LATEX_CASES)
+    def test_extract_from_latex(self, extractor, latex, count, label, needle):
         claims = extractor.extract_claims("", latex_blocks=[latex])
-        assert len(claims) == 1
-    
-    def test_extract_bracket_equation(self):
-        latex = r"\[E = \hbar\omega\]"
-        extractor = ClaimExtractor()
+        assert len(claims) == count
+        if label is not None:
+            assert claims[0].suggested_label == label
+        if needle is not None:
+            assert needle in claims[0].statement
+    
+    def test_latex_equations_in_source_order(self, extractor):
+        latex = r"$a=b$ $$c=d$$ \[g=h\] $e=f$"
         claims = extractor.extract_claims("", latex_blocks=[latex])
-        assert len(claims) == 1
-    
-    def test_extract_proposition(self):
-        text = "Proposition 3 shows that the limit exists."
-        extractor = ClaimExtractor()
-        claims = extractor.extract_claims(text)
-        assert len(claims) >= 1
-    
-    def test_extract_corollary(self):
-        text = "Corollary 2 implies that the function is continuous."
-        extractor = ClaimExtractor()
-        claims = extractor.extract_claims(text)
-        assert len(claims) >= 1
-    
-    def test_extract_numerical_result(self):
-        text = "The numerical simulation shows that x = 7.5."
-        extractor = ClaimExtractor()
-        claims = extractor.extract_claims(text)
-        assert len(claims) >= 1
-        assert claims[0].suggested_label == ClaimLabel.COMPUTED
-    
-    def test_extract_hence_statement(self):
-        text = "Hence, the system is stable."
-        extractor = ClaimExtractor()
-        claims = extractor.extract_claims(text)
-        assert len(claims) >= 1
-        assert claims[0].suggested_label == ClaimLabel.DERIVED
-    
-    def test_extract_from_reference(self):
-        text = "From Ref. [5], we know that the constant is 2.718."
-        extractor = ClaimExtractor()
-        claims = extractor.extract_claims(text)
-        assert len(claims) >= 1
-        assert claims[0].suggested_label == ClaimLabel.CITED
+        assert [c.statement for c in claims] == ["$a=b$", "$$c=d$$", r"\[g=h\]", "$e=f$"]
 
 
 class TestClaimExtractorNegative:
     
-    def test_pure_variable_declaration(self):
+    def test_pure_variable_declaration(self, extractor):
         text = "Let x be a real number."
-        extractor = ClaimExtractor()
         claims = extractor.extract_claims(text)
         assert len(claims) == 0
     
-    def test_pure_definition_without_relation(self):
+    def test_pure_definition_without_relation(self, extractor):
         text = "We define the velocity as the rate of change of position."
-        extractor = ClaimExtractor()
         claims = extractor.extract_claims(text)
         assert len(claims) == 0
     
-    def test_denote_statement(self):
+    def test_denote_statement(self, extractor):
         text = "We denote the mass by m."
-        extractor = ClaimExtractor()
         claims = extractor.extract_claims(text)
         assert len(claims) == 0
     
-    def test_leak_phrase_obviously(self):
+    def test_leak_phrase_obviously(self, extractor):
         text = "Obviously, the result is positive."
-        extractor = ClaimExtractor()
         claims = extractor.extract_claims(text)
         assert len(claims) >= 1
         assert claims[0].suggested_label == ClaimLabel.SPECULATIVE
     
-    def test_leak_phrase_clearly(self):
+    def test_leak_phrase_clearly(self, extractor):
         text = "Clearly, this implies convergence."
-        extractor = ClaimExtractor()
         claims = extractor.extract_claims(text)
         assert len(claims) >= 1
         assert claims[0].suggested_label == ClaimLabel.SPECULATIVE
     
-    def test_leak_phrase_well_known(self):
+    def test_leak_phrase_well_known(self, extractor):
         text = "It is well-known that pi is irrational."
-        extractor = ClaimExtractor()
         claims = extractor.extract_claims(text)
         assert len(claims) >= 1
         assert claims[0].suggested_label == ClaimLabel.SPECULATIVE
     
-    def test_leak_phrase_by_symmetry(self):
+    def test_leak_phrase_by_symmetry(self, extractor):
         text = "By symmetry, the integral equals zero."
-        extractor = ClaimExtractor()
         claims = extractor.extract_claims(text)
         assert len(claims) >= 1
         assert claims[0].suggested_label == ClaimLabel.SPECULATIVE
     
-    def test_leak_phrase_trivially(self):
+    def test_leak_phrase_trivially(self, extractor):
         text = "Trivially, the sum is finite."
-        extractor = ClaimExtractor()
         claims = extractor.extract_claims(text)
         assert len(claims) >= 1
         assert claims[0].suggested_label == ClaimLabel.SPECULATIVE
     
-    def test_leak_phrase_straightforward(self):
+    def test_leak_phrase_straightforward(self, extractor):
         text = "It is straightforward to show that x > 0."
-        extractor = ClaimExtractor()
         claims = extractor.extract_claims(text)
         assert len(claims) >= 1
         assert claims[0].suggested_label == ClaimLabel.SPECULATIVE
     
-    def test_multi_claim_sentence_splitting(self):
+    def test_multi_claim_sentence_splitting(self, extractor):
         text = "The energy is conserved and the momentum is constant."
-        extractor = ClaimExtractor()
         claims = extractor.extract_claims(text)
         assert len(claims) >= 2
     
-    def test_empty_equation(self):
+    def test_empty_equation(self, extractor):
         latex = r"$$$$"
-        extractor = ClaimExtractor()
         claims = extractor.extract_claims("", latex_blocks=[latex])
         assert len(claims) == 0
     
-    def test_equation_without_equals(self):
+    def test_equation_without_equals(self, extractor):
         latex = r"$$x + y$$"
-        extractor = ClaimExtractor()
         claims = extractor.extract_claims("", latex_blocks=[latex])
         assert len(claims) == 0
     
-    def test_short_non_substantive_text(self):
+    def test_short_non_substantive_text(self, extractor):
         text = "Yes."
-        extractor = ClaimExtractor()
         claims = extractor.extract_claims(text)
         assert len(claims) == 0
     
-    def test_question_not_claim(self):
+    def test_question_not_claim(self, extractor):
         text = "What is the value of x?"
-        extractor = ClaimExtractor()
         claims = extractor.extract_claims(text)
         assert len(claims) == 0
 
 
+class TestExtractClaimsBatch:
+    
+    DOCS = [
+        "The energy is $E = mc^2$.",
+        "Therefore, the momentum is conserved.",
+        "Yes.",
+        "The energy is conserved and the momentum is constant.",
+    ]
+    
+    def test_batch_process_pool_smoke(self):
+        # The only test that starts a process pool; keep it to two documents
+        docs = self.DOCS[:2]
+        assert extract_claims_batch(docs, workers=2) == [extract_claims(doc) for doc in docs]
+    
+    def test_batch_thread_pool_matches_serial_extraction(self):
+        results = extract_claims_batch(self.DOCS, workers=2, use_threads=True)
+        assert results == [extract_claims(doc) for doc in self.DOCS]
+    
+    def test_batch_single_worker_runs_in_process(self):
+        results = extract_claims_batch(self.DOCS, workers=1)
+        assert results == [extract_claims(doc) for doc in self.DOCS]
+    
+    def test_batch_empty(self):
+        assert extract_claims_batch([]) == []
+
+
 class TestUnsupportedClaimRate:
     
     def test_no_claims(self):
@@ -278,41 +184,22 @@ class TestUnsupportedClaimRate:
         rate = compute_unsupported_claim_rate(claims)
         assert rate == 0.0
     
-    def test_all_speculative(self):
+    def test_all_speculative(self, speculative_claims):
         from src.core.integrity import compute_unsupported_claim_rate
-        from src.core.claim import Claim, ClaimLabel
         
-        claims = [
-            Claim.create("claim 1", ClaimLabel.SPECULATIVE),
-            Claim.create("claim 2", ClaimLabel.SPECULATIVE),
-        ]
-        rate = compute_unsupported_claim_rate(claims)
+        rate = compute_unsupported_claim_rate(speculative_claims)
         assert rate == 0.0
     
-    def test_all_supported(self):
+    def test_all_supported(self, supported_claims):
         from src.core.integrity import compute_unsupported_claim_rate
-        from src.core.claim import Claim, ClaimLabel
         
-        claims = [
-            Claim.create("claim 1", ClaimLabel.DERIVED),
-            Claim.create("claim 2", ClaimLabel.COMPUTED),
-        ]
-        claims[0].evidence_ids = ["evidence_1"]
-        claims[1].evidence_ids = ["evidence_2"]
-        
-        rate = compute_unsupported_claim_rate(claims)
+        rate = compute_unsupported_claim_rate(supported_claims)
         assert rate == 0.0
     
-    def test_all_unsupported(self):
+    def test_all_unsupported(self, unsupported_claims):
         from src.core.integrity import compute_unsupported_claim_rate
-        from src.core.claim import Claim, ClaimLabel
         
-        claims = [
-            Claim.create("claim 1", ClaimLabel.DERIVED),
-            Claim.create("claim 2", ClaimLabel.COMPUTED),
-        ]
-        
-        rate = compute_unsupported_claim_rate(claims)
+        rate = compute_unsupported_claim_rate(unsupported_claims)
         assert rate == 1.0
     
     def test_mixed_support(self):
@@ -354,44 +241,24 @@ class TestFinalizationCheck:
         assert len(reasons) > 0
         assert "No claims extracted - cannot finalize" in reasons[0]
     
-    def test_only_speculative_can_finalize(self):
+    def test_only_speculative_can_finalize(self, speculative_claims):
         from src.core.integrity import finalization_check
-        from src.core.claim import Claim, ClaimLabel
         
-        claims = [
-            Claim.create("claim 1", ClaimLabel.SPECULATIVE),
-            Claim.create("claim 2", ClaimLabel.SPECULATIVE),
-        ]
-        
-        can_finalize, reasons = finalization_check(claims)
+        can_finalize, reasons = finalization_check(speculative_claims)
         assert can_finalize is True
         assert len(reasons) == 0
     
-    def test_all_supported_can_finalize(self):
+    def test_all_supported_can_finalize(self, supported_claims):
         from src.core.integrity import finalization_check
-        from src.core.claim import Claim, ClaimLabel
         
-        claims = [
-            Claim.create("claim 1", ClaimLabel.DERIVED),
-            Claim.create("claim 2", ClaimLabel.COMPUTED),
-        ]
-        claims[0].evidence_ids = ["evidence_1"]
-        claims[1].evidence_ids = ["evidence_2"]
-        
-        can_finalize, reasons = finalization_check(claims)
+        can_finalize, reasons = finalization_check(supported_claims)
         assert can_finalize is True
         assert len(reasons) == 0
     
-    def test_unsupported_blocks_finalization(self):
+    def test_unsupported_blocks_finalization(self, unsupported_claims):
         from src.core.integrity import finalization_check
-        from src.core.claim import Claim, ClaimLabel
         
-        claims = [
-            Claim.create("claim 1", ClaimLabel.DERIVED),
-            Claim.create("claim 2", ClaimLabel.COMPUTED),
-        ]
-        
-        can_finalize, reasons = finalization_check(claims)
+        can_finalize, reasons = finalization_check(unsupported_claims)
         assert can_finalize is False
         assert len(reasons) > 0
         assert "unsupported" in reasons[0].lower()
@@ -1,31 +1,34 @@
-import json
+import re
 import pytest
-from pathlib import Path
 from src.core.claim import Claim, ClaimLabel
 from src.core.integrity import finalization_check, compute_unsupported_claim_rate
 
 
+_LABELS = dict(ClaimLabel.__members__)
+_BLANK_STATEMENT_ERROR = re.compile("Claim statement must be non-empty after trimming whitespace")
+
+
+def _claim_from_dict(claim_data: dict) -> Claim:
+    return Claim(
+        claim_id=claim_data["claim_id"],
+        statement=claim_data["statement"],
+        claim_label=_LABELS[claim_data["claim_label"]],
+        step_id=claim_data["step_id"],
+        # Copy: the fixture dict is cached and shared across tests
+        evidence_ids=list(claim_data["evidence_ids"]),
+        claim_span=claim_data["claim_span"],
+    )
+
+
 class TestFixtures:
     
-    def test_report_incomplete_valid_fixture(self):
-        fixture_path = Path(__file__).parent / "fixtures" / "report_incomplete_valid.json"
-        with open(fixture_path, 'r') as f:
-            data = json.load(f)
+    def test_report_incomplete_valid_fixture(self, report_incomplete_valid):
+        data = report_incomplete_valid
         
         assert data["status"] == "INCOMPLETE"
         assert len(data["claims"]) == 2
         
-        claims = []
-        for claim_data in data["claims"]:
-            claim = Claim(
-                claim_id=claim_data["claim_id"],
-                statement=claim_data["statement"],
-                claim_label=ClaimLabel[claim_data["claim_label"]],
-                step_id=claim_data["step_id"],
-                evidence_ids=claim_data["evidence_ids"],
-                claim_span=claim_data["claim_span"],
-            )
-            claims.append(claim)
+        claims = [_claim_from_dict(claim_data) for claim_data in data["claims"]]
         
         can_finalize, reasons = finalization_check(claims)
         assert can_finalize is False
@@ -34,28 +37,16 @@ class TestFixtures:
         rate = compute_unsupported_claim_rate(claims)
         assert rate == 1.0
     
-    def test_report_invalid_whitespace_statement_fixture(self):
-        fixture_path = Path(__file__).parent / "fixtures" / "report_invalid_whitespace_statement.json"
-        with open(fixture_path, 'r') as f:
-            data = json.load(f)
+    def test_report_invalid_whitespace_statement_fixture(self, report_invalid_whitespace_statement):
+        data = report_invalid_whitespace_statement
         
         assert data["status"] == "INVALID"
         
-        with pytest.raises(ValueError, match="Claim statement must be non-empty after trimming whitespace"):
-            claim_data = data["claims"][0]
-            Claim(
-                claim_id=claim_data["claim_id"],
-                statement=claim_data["statement"],
-                claim_label=ClaimLabel[claim_data["claim_label"]],
-                step_id=claim_data["step_id"],
-                evidence_ids=claim_data["evidence_ids"],
-                claim_span=claim_data["claim_span"],
-            )
+        with pytest.raises(ValueError, match=_BLANK_STATEMENT_ERROR):
+            _claim_from_dict(data["claims"][0])
     
-    def test_report_zero_claims_fixture(self):
-        fixture_path = Path(__file__).parent / "fixtures" / "report_zero_claims.json"
-        with open(fixture_path, 'r') as f:
-            data = json.load(f)
+    def test_report_zero_claims_fixture(self, report_zero_claims):
+        data = report_zero_claims
         
         assert data["status"] == "INCOMPLETE"
         assert len(data["claims"]) == 0
@@ -70,37 +61,21 @@ class TestFixtures:
 
 class TestWhitespaceValidation:
     
-    def test_claim_rejects_empty_statement(self):
-        with pytest.raises(ValueError, match="Claim statement must be non-empty after trimming whitespace"):
-            Claim.create("", ClaimLabel.DERIVED)
-    
-    def test_claim_rejects_whitespace_only_statement(self):
-        with pytest.raises(ValueError, match="Claim statement must be non-empty after trimming whitespace"):
-            Claim.create("   ", ClaimLabel.DERIVED)
-    
-    def test_claim_rejects_tabs_only_statement(self):
-        with pytest.raises(ValueError, match="Claim statement must be non-empty after trimming whitespace"):
-            Claim.create("\t\t\t", ClaimLabel.DERIVED)
-    
-    def test_claim_rejects_newlines_only_statement(self):
-        with pytest.raises(ValueError, match="Claim statement must be non-empty after trimming whitespace"):
-            Claim.create("\n\n", ClaimLabel.DERIVED)
+    @pytest.mark.parametrize("statement", ["", "   ", "\t\t\t", "\n\n"])
+    def test_claim_rejects_blank_statement(self, statement):
+        with pytest.raises(ValueError, match=_BLANK_STATEMENT_ERROR):
+            Claim.create(statement, ClaimLabel.DERIVED)
     
     def test_claim_accepts_valid_statement(self):
         claim = Claim.create("E = mc^2", ClaimLabel.DERIVED)
         assert claim.statement == "E = mc^2"
     
-    def test_claim_draft_rejects_empty_statement(self):
-        from src.core.claim import ClaimDraft
-        
-        with pytest.raises(ValueError, match="Claim statement must be non-empty after trimming whitespace"):
-            ClaimDraft("")
-    
-    def test_claim_draft_rejects_whitespace_only_statement(self):
+    @pytest.mark.parametrize("statement", ["", "   "])
+    def test_claim_draft_rejects_blank_statement(self, statement):
         from src.core.claim import ClaimDraft
         
-        with pytest.raises(ValueError, match="Claim statement must be non-empty after trimming whitespace"):
-            ClaimDraft("   ")
+        with pytest.raises(ValueError, match=_BLANK_STATEMENT_ERROR):
+            ClaimDraft(statement)
 
 
 class TestZeroClaimsFinalization:
@@ -113,10 +88,10 @@ class TestZeroClaimsFinalization:
     def test_zero_claims_provides_checklist(self):
         can_finalize, reasons = finalization_check([])
         assert "Checklist:" in reasons[1]
-        assert any("derivation steps" in r for r in reasons)
-        assert any("equations/identities" in r for r in reasons)
-        assert any("source attributions" in r for r in reasons)
-        assert any("no derivation possible yet" in r for r in reasons)
+        # Needles contain no newline, so they cannot match across two reasons
+        joined = "\n".join(reasons)
+        for needle in ("derivation steps", "equations/identities", "source attributions", "no derivation possible yet"):
+            assert needle in joined
     
     def test_only_speculative_claims_can_finalize(self):
         claims = [
@@ -43,9 +43,12 @@ from src.core.gc11_validators import (
 from src.core.run_manifest import LogReference, LogType, RunManifest
 
 
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
 def _load_fixture(name: str) -> dict:
     """Load a GC-11 fixture file."""
-    fixture_path = Path(__file__).parent / "fixtures" / name
+    fixture_path = FIXTURES_DIR / name
     with open(fixture_path, "r") as f:
         return json.load(f)
 
@@ -43,9 +43,12 @@ from src.core.rag_firewall import (
 from src.core.report_checks import ReportStatus
 
 
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
 def _load_fixture(name: str) -> dict:
     """Load a GC-14 fixture file."""
-    fixture_path = Path(__file__).parent / "fixtures" / name
+    fixture_path = FIXTURES_DIR / name
     with open(fixture_path, "r") as f:
         return json.load(f)
 
@@ -48,9 +48,12 @@ from src.core.regression_gating import (
 )
 
 
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
 def _load_fixture(name: str) -> dict:
     """Load a GC-15 fixture file."""
-    fixture_path = Path(__file__).parent / "fixtures" / name
+    fixture_path = FIXTURES_DIR / name
     with open(fixture_path, "r") as f:
         return json.load(f)
 
@@ -7,11 +7,15 @@ Tests enforce strict validation per GC-2:
 - No whitespace variants, no lowercase, no lists
 """
 
-import json
+import re
 import pytest
-from pathlib import Path
 from src.core.claim import Claim, ClaimLabel
 from src.core.validators import validate_claim_label_string, validate_claim_label_from_dict
+from tests._fixture_cache import load_fixture
+
+
+# Error-message patterns shared by several tests, compiled once
+_WHITESPACE_ERROR = re.compile("has invalid whitespace")
 
 
 class TestClaimLabelEnum:
@@ -52,82 +56,31 @@ class TestClaimLabelValidation:
                 claim_label=None,
             )
     
-    def test_claim_label_invalid_value_fails(self):
-        """GC-2: Invalid label value must fail"""
-        with pytest.raises(ValueError, match="Invalid claim label: 'ASSUMED'"):
-            validate_claim_label_string("ASSUMED")
-        
-        with pytest.raises(ValueError, match="Invalid claim label: 'PROVEN'"):
-            validate_claim_label_string("PROVEN")
-        
-        with pytest.raises(ValueError, match="Invalid claim label: 'VERIFIED'"):
-            validate_claim_label_string("VERIFIED")
-    
-    def test_claim_label_trailing_space_fails(self):
-        """GC-2: Trailing space must fail"""
-        with pytest.raises(ValueError, match="invalid whitespace: 'DERIVED '"):
-            validate_claim_label_string("DERIVED ")
-        
-        with pytest.raises(ValueError, match="invalid whitespace: 'COMPUTED '"):
-            validate_claim_label_string("COMPUTED ")
-    
-    def test_claim_label_leading_space_fails(self):
-        """GC-2: Leading space must fail"""
-        with pytest.raises(ValueError, match="invalid whitespace: ' CITED'"):
-            validate_claim_label_string(" CITED")
-        
-        with pytest.raises(ValueError, match="invalid whitespace: ' SPECULATIVE'"):
-            validate_claim_label_string(" SPECULATIVE")
-    
-    def test_claim_label_lowercase_fails(self):
-        """GC-2: Lowercase must fail"""
-        with pytest.raises(ValueError, match="must be uppercase: got 'derived'"):
-            validate_claim_label_string("derived")
-        
-        with pytest.raises(ValueError, match="must be uppercase: got 'computed'"):
-            validate_claim_label_string("computed")
-        
-        with pytest.raises(ValueError, match="must be uppercase: got 'cited'"):
-            validate_claim_label_string("cited")
-        
-        with pytest.raises(ValueError, match="must be uppercase: got 'speculative'"):
-            validate_claim_label_string("speculative")
-    
-    def test_claim_label_mixed_case_fails(self):
-        """GC-2: Mixed case must fail"""
-        with pytest.raises(ValueError, match="must be uppercase: got 'Derived'"):
-            validate_claim_label_string("Derived")
-        
-        with pytest.raises(ValueError, match="must be uppercase: got 'Computed'"):
-            validate_claim_label_string("Computed")
-    
-    def test_claim_label_list_type_fails(self):
-        """GC-2: List type must fail"""
-        with pytest.raises(TypeError, match="cannot be a list"):
-            validate_claim_label_string(["DERIVED"])
-        
-        with pytest.raises(TypeError, match="cannot be a list"):
-            validate_claim_label_string(["DERIVED", "COMPUTED"])
-    
-    def test_claim_label_dict_type_fails(self):
-        """GC-2: Dict type must fail"""
-        with pytest.raises(TypeError, match="cannot be a dict"):
-            validate_claim_label_string({"label": "DERIVED"})
-    
-    def test_claim_label_null_fails(self):
-        """GC-2: Null/None must fail"""
-        with pytest.raises(ValueError, match="cannot be None"):
-            validate_claim_label_string(None)
-    
-    def test_claim_label_empty_string_fails(self):
-        """GC-2: Empty string must fail"""
-        with pytest.raises(ValueError, match="cannot be empty string"):
-            validate_claim_label_string("")
-    
-    def test_claim_label_integer_type_fails(self):
-        """GC-2: Integer type must fail"""
-        with pytest.raises(TypeError, match="must be string, got int"):
-            validate_claim_label_string(42)
+    @pytest.mark.parametrize("wire, exc, match", [
+        pytest.param("ASSUMED", ValueError, "Invalid claim label: 'ASSUMED'", id="invalid_assumed"),
+        pytest.param("PROVEN", ValueError, "Invalid claim label: 'PROVEN'", id="invalid_proven"),
+        pytest.param("VERIFIED", ValueError, "Invalid claim label: 'VERIFIED'", id="invalid_verified"),
+        pytest.param("DERIVED ", ValueError, "invalid whitespace: 'DERIVED '", id="trailing_space_derived"),
+        pytest.param("COMPUTED ", ValueError, "invalid whitespace: 'COMPUTED '", id="trailing_space_computed"),
+        pytest.param(" CITED", ValueError, "invalid whitespace: ' CITED'", id="leading_space_cited"),
+        pytest.param(" SPECULATIVE", ValueError, "invalid whitespace: ' SPECULATIVE'", id="leading_space_speculative"),
+        pytest.param("derived", ValueError, "must be uppercase: got 'derived'", id="lowercase_derived"),
+        pytest.param("computed", ValueError, "must be uppercase: got 'computed'", id="lowercase_computed"),
+        pytest.param("cited", ValueError, "must be uppercase: got 'cited'", id="lowercase_cited"),
+        pytest.param("speculative", ValueError, "must be uppercase: got 'speculative'", id="lowercase_speculative"),
+        pytest.param("Derived", ValueError, "must be uppercase: got 'Derived'", id="mixed_case_derived"),
+        pytest.param("Computed", ValueError, "must be uppercase: got 'Computed'", id="mixed_case_computed"),
+        pytest.param(["DERIVED"], TypeError, "cannot be a list", id="list_single"),
+        pytest.param(["DERIVED", "COMPUTED"], TypeError, "cannot be a list", id="list_multiple"),
+        pytest.param({"label": "DERIVED"}, TypeError, "cannot be a dict", id="dict"),
+        pytest.param(None, ValueError, "cannot be None", id="null"),
+        pytest.param("", ValueError, "cannot be empty string", id="empty_string"),
+        pytest.param(42, TypeError, "must be string, got int", id="integer"),
+    ])
+    def test_claim_label_invalid_fails(self, wire, exc, match):
+        """GC-2: Invalid values, whitespace/case variants and non-string types must fail"""
+        with pytest.raises(exc, match=match):
+            validate_claim_label_string(wire)
     
     def test_claim_label_valid_accepts_all_four(self):
         """GC-2: All 4 valid labels must be accepted"""
@@ -158,9 +111,7 @@ class TestGC2Fixtures:
     
     def test_gc2_valid_all_labels_fixture(self):
         """GC-2: Valid fixture with all 4 labels"""
-        fixture_path = Path(__file__).parent / "fixtures" / "gc2_valid_all_labels.json"
-        with open(fixture_path, 'r') as f:
-            data = json.load(f)
+        data = load_fixture("gc2_valid_all_labels.json")
         
         assert len(data["claims"]) == 4
         
@@ -178,9 +129,7 @@ class TestGC2Fixtures:
     
     def test_gc2_invalid_label_assumed_fixture(self):
         """GC-2: Invalid label 'ASSUMED' must fail"""
-        fixture_path = Path(__file__).parent / "fixtures" / "gc2_invalid_label_assumed.json"
-        with open(fixture_path, 'r') as f:
-            data = json.load(f)
+        data = load_fixture("gc2_invalid_label_assumed.json")
         
         claim_data = data["claims"][0]
         with pytest.raises(ValueError, match="Invalid ClaimLabel: 'ASSUMED'"):
@@ -188,9 +137,7 @@ class TestGC2Fixtures:
     
     def test_gc2_invalid_label_lowercase_fixture(self):
         """GC-2: Lowercase label must fail"""
-        fixture_path = Path(__file__).parent / "fixtures" / "gc2_invalid_label_lowercase.json"
-        with open(fixture_path, 'r') as f:
-            data = json.load(f)
+        data = load_fixture("gc2_invalid_label_lowercase.json")
         
         claim_data = data["claims"][0]
         with pytest.raises(ValueError, match="must be uppercase"):
@@ -198,29 +145,23 @@ class TestGC2Fixtures:
     
     def test_gc2_invalid_label_trailing_space_fixture(self):
         """GC-2: Trailing space must fail"""
-        fixture_path = Path(__file__).parent / "fixtures" / "gc2_invalid_label_trailing_space.json"
-        with open(fixture_path, 'r') as f:
-            data = json.load(f)
+        data = load_fixture("gc2_invalid_label_trailing_space.json")
         
         claim_data = data["claims"][0]
-        with pytest.raises(ValueError, match="has invalid whitespace"):
+        with pytest.raises(ValueError, match=_WHITESPACE_ERROR):
             validate_claim_label_from_dict(claim_data)
     
     def test_gc2_invalid_label_leading_space_fixture(self):
         """GC-2: Leading space must fail"""
-        fixture_path = Path(__file__).parent / "fixtures" / "gc2_invalid_label_leading_space.json"
-        with open(fixture_path, 'r') as f:
-            data = json.load(f)
+        data = load_fixture("gc2_invalid_label_leading_space.json")
         
         claim_data = data["claims"][0]
-        with pytest.raises(ValueError, match="has invalid whitespace"):
+        with pytest.raises(ValueError, match=_WHITESPACE_ERROR):
             validate_claim_label_from_dict(claim_data)
     
     def test_gc2_invalid_label_null_fixture(self):
         """GC-2: Null label must fail"""
-        fixture_path = Path(__file__).parent / "fixtures" / "gc2_invalid_label_null.json"
-        with open(fixture_path, 'r') as f:
-            data = json.load(f)
+        data = load_fixture("gc2_invalid_label_null.json")
         
         claim_data = data["claims"][0]
         with pytest.raises(ValueError, match="Invalid ClaimLabel: None"):
@@ -228,9 +169,7 @@ class TestGC2Fixtures:
     
     def test_gc2_invalid_label_empty_fixture(self):
         """GC-2: Empty string label must fail"""
-        fixture_path = Path(__file__).parent / "fixtures" / "gc2_invalid_label_empty.json"
-        with open(fixture_path, 'r') as f:
-            data = json.load(f)
+        data = load_fixture("gc2_invalid_label_empty.json")
         
         claim_data = data["claims"][0]
         with pytest.raises(ValueError, match="Invalid ClaimLabel: empty string"):
@@ -238,9 +177,7 @@ class TestGC2Fixtures:
     
     def test_gc2_invalid_label_list_fixture(self):
         """GC-2: List label must fail"""
-        fixture_path = Path(__file__).parent / "fixtures" / "gc2_invalid_label_list.json"
-        with open(fixture_path, 'r') as f:
-            data = json.load(f)
+        data = load_fixture("gc2_invalid_label_list.json")
         
         claim_data = data["claims"][0]
         with pytest.raises(TypeError, match="expected string, got list"):
@@ -248,9 +185,7 @@ class TestGC2Fixtures:
     
     def test_gc2_invalid_label_missing_fixture(self):
         """GC-2: Missing label field must fail"""
-        fixture_path = Path(__file__).parent / "fixtures" / "gc2_invalid_label_missing.json"
-        with open(fixture_path, 'r') as f:
-            data = json.load(f)
+        data = load_fixture("gc2_invalid_label_missing.json")
         
         claim_data = data["claims"][0]
         with pytest.raises(KeyError, match="Missing required field 'claim_label'"):
@@ -290,3 +225,13 @@ class TestClaimConstructionWithLabels:
                 statement="Test",
                 claim_label=1,
             )
+    
+    def test_claim_create_ids_unique_and_wire_safe(self):
+        """Claim.create IDs are unique and pass the claim_id wire parser"""
+        from src.core.id_parsers import parse_claim_id
+        
+        claims = [Claim.create(f"Statement {i}", ClaimLabel.DERIVED) for i in range(100)]
+        claim_ids = [c.claim_id for c in claims]
+        assert len(set(claim_ids)) == len(claim_ids)
+        for claim_id in claim_ids:
+            assert parse_claim_id(claim_id) == claim_id
@@ -4,17 +4,18 @@ GC-3 Step/Claim Boundary Tests
 Tests for strict structural validation of DerivationStep and ScientificReport.
 """
 
-import json
+import dataclasses
 import pytest
-from pathlib import Path
 from src.core.claim import Claim, ClaimLabel
 from src.core.step import DerivationStep, StepStatus
 from src.core.report import ScientificReport
 from src.core.structure_validators import (
     StructureValidator,
     ValidationError,
+    invalidate_structure_cache,
     validate_report_structure,
 )
+from tests._fixture_cache import load_fixture
 
 
 class TestDerivationStepSchema:
@@ -105,6 +106,46 @@ class TestDerivationStepSchema:
         assert len(step.step_id) > 0
         assert step.claim_ids == ["claim-001", "claim-002"]
         assert step.step_status == StepStatus.CHECKED
+    
+    def test_step_create_ids_unique_and_wire_safe(self):
+        """GC-3: Step.create IDs are unique and pass the step_id wire parser"""
+        from src.core.id_parsers import parse_step_id
+        
+        steps = [DerivationStep.create(claim_ids=[f"claim-{i}"], statement="Step") for i in range(100)]
+        step_ids = [s.step_id for s in steps]
+        assert len(set(step_ids)) == len(step_ids)
+        for step_id in step_ids:
+            assert parse_step_id(step_id) == step_id
+    
+    def test_step_unchecked_matches_validated_construction(self):
+        """GC-3: _unchecked builds the same step as the validating constructor"""
+        kwargs = dict(
+            step_id="step-001",
+            claim_ids=["claim-001"],
+            statement="Test derivation step",
+            step_status=StepStatus.CHECKED,
+        )
+        assert DerivationStep._unchecked(**kwargs) == DerivationStep(**kwargs)
+    
+    def test_step_unchecked_skips_validation(self):
+        """GC-3: _unchecked trusts its input (no DUPLICATE_CLAIM_IN_STEP)"""
+        step = DerivationStep._unchecked(
+            step_id="step-001",
+            claim_ids=["claim-001", "claim-001"],
+            statement="Test derivation step",
+        )
+        assert step.claim_ids == ["claim-001", "claim-001"]
+        assert step.depends_on == []
+    
+    def test_step_is_immutable(self):
+        """GC-3: steps are validated once at construction and cannot be mutated"""
+        step = DerivationStep(
+            step_id="step-001",
+            claim_ids=["claim-001"],
+            statement="Test derivation step",
+        )
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            step.step_status = StepStatus.CHECKED
 
 
 class TestScientificReportSchema:
@@ -156,31 +197,43 @@ class TestScientificReportSchema:
             ScientificReport(claims=[claim], steps=[step1, step2])
 
 
+@pytest.fixture(scope="module")
+def single_claim_step():
+    # Claims and steps are only read by reports, so one pair can be shared;
+    # tests needing a variant derive it with dataclasses.replace
+    claim = Claim.create("Test claim", ClaimLabel.DERIVED)
+    step = DerivationStep(
+        step_id="step-001",
+        claim_ids=[claim.claim_id],
+        statement="Test derivation step",
+    )
+    return claim, step
+
+
+@pytest.fixture(scope="module")
+def two_claims():
+    return (
+        Claim.create("First claim", ClaimLabel.DERIVED),
+        Claim.create("Second claim", ClaimLabel.COMPUTED),
+    )
+
+
 class TestStructuralValidation:
     """Test structural validation rules V1-V4"""
     
-    def test_step_claim_ids_resolve(self):
+    def test_step_claim_ids_resolve(self, single_claim_step):
         """GC-3 V1: Referenced claim_ids must exist"""
-        claim = Claim.create("Test claim", ClaimLabel.DERIVED)
-        step = DerivationStep(
-            step_id="step-001",
-            claim_ids=[claim.claim_id],
-            statement="Test derivation step",
-        )
+        claim, step = single_claim_step
         report = ScientificReport(claims=[claim], steps=[step])
         
         is_valid, errors = validate_report_structure(report)
         assert is_valid
         assert len(errors) == 0
     
-    def test_dangling_claim_id_rejected(self):
+    def test_dangling_claim_id_rejected(self, single_claim_step):
         """GC-3 V1: Dangling claim_id reference rejected (DANGLING_CLAIM_ID)"""
-        claim = Claim.create("Test claim", ClaimLabel.DERIVED)
-        step = DerivationStep(
-            step_id="step-001",
-            claim_ids=[claim.claim_id, "non-existent-claim"],
-            statement="Test derivation step",
-        )
+        claim, step = single_claim_step
+        step = dataclasses.replace(step, claim_ids=[claim.claim_id, "non-existent-claim"])
         report = ScientificReport(claims=[claim], steps=[step])
         
         is_valid, errors = validate_report_structure(report)
@@ -206,6 +259,85 @@ class TestStructuralValidation:
         assert errors[0].category == "ORPHAN_CLAIM"
         assert claim2.claim_id in errors[0].message
     
+    def test_fail_fast_returns_first_error_only(self):
+        """GC-3: fail_fast stops at the first error a full validation reports"""
+        claim1 = Claim.create("Referenced claim", ClaimLabel.DERIVED)
+        claim2 = Claim.create("Orphan claim", ClaimLabel.SPECULATIVE)
+        step = DerivationStep(
+            step_id="step-001",
+            claim_ids=[claim1.claim_id, "non-existent-claim"],
+            statement="Test derivation step",
+            depends_on=["missing-step"],
+        )
+        report = ScientificReport(claims=[claim1, claim2], steps=[step])
+        
+        _, all_errors = validate_report_structure(report)
+        is_valid, errors = validate_report_structure(report, fail_fast=True)
+        assert len(all_errors) == 3
+        assert not is_valid
+        assert errors == all_errors[:1]
+    
+    def test_cached_validation_reused_while_report_unchanged(self, single_claim_step):
+        """GC-3: use_cache reuses the stored result for an unchanged report"""
+        claim, step = single_claim_step
+        report = ScientificReport(claims=[claim], steps=[step])
+        assert validate_report_structure(report, use_cache=True) == (True, [])
+        cached = report._structure_cache
+        
+        assert validate_report_structure(report, use_cache=True) == (True, [])
+        assert report._structure_cache is cached
+    
+    def test_cached_validation_never_returns_stale_pass(self, single_claim_step):
+        """GC-3: Mutating claims or steps after a cached call revalidates (fail-closed)"""
+        claim, step = single_claim_step
+        step = dataclasses.replace(step, depends_on=[])
+        report = ScientificReport(claims=[claim], steps=[step])
+        assert validate_report_structure(report, use_cache=True) == (True, [])
+        
+        report.claims.append(Claim.create("Orphan claim", ClaimLabel.SPECULATIVE))
+        is_valid, errors = validate_report_structure(report, use_cache=True)
+        assert not is_valid
+        assert [e.category for e in errors] == ["ORPHAN_CLAIM"]
+        
+        report.claims.pop()
+        step.depends_on.append("missing-step")
+        is_valid, errors = validate_report_structure(report, use_cache=True)
+        assert not is_valid
+        assert [e.category for e in errors] == ["DANGLING_STEP_DEP"]
+    
+    def test_get_owning_step(self, two_claims):
+        """GC-3: get_owning_step maps claim_id to its owning step_id"""
+        claim1, claim2 = two_claims
+        step1 = DerivationStep(step_id="step-001", claim_ids=[claim1.claim_id], statement="First step")
+        step2 = DerivationStep(step_id="step-002", claim_ids=[claim2.claim_id], statement="Second step")
+        report = ScientificReport(claims=[claim1, claim2], steps=[step1, step2])
+        
+        assert report.get_owning_step(claim1.claim_id) == "step-001"
+        assert report.get_owning_step(claim2.claim_id) == "step-002"
+        assert report.get_owning_step("non-existent-claim") is None
+    
+    def test_get_owning_step_requires_invalidate_after_mutation(self, two_claims):
+        """GC-3: get_owning_step keeps its index until invalidate_caches()"""
+        claim1, claim2 = two_claims
+        step1 = DerivationStep(step_id="step-001", claim_ids=[claim1.claim_id], statement="First step")
+        step2 = DerivationStep(step_id="step-002", claim_ids=[claim2.claim_id], statement="Second step")
+        report = ScientificReport(claims=[claim1, claim2], steps=[step1, step2])
+        assert report.get_owning_step(claim2.claim_id) == "step-002"
+        
+        report.steps.pop()
+        report.steps.append(
+            DerivationStep(step_id="step-003", claim_ids=[claim2.claim_id], statement="Third step")
+        )
+        # The index is not rebuilt on its own; mutation must be announced
+        assert report.get_owning_step(claim2.claim_id) == "step-002"
+        
+        report.invalidate_caches()
+        assert report.get_owning_step(claim2.claim_id) == "step-003"
+        
+        report.steps.pop()
+        invalidate_structure_cache(report)
+        assert report.get_owning_step(claim2.claim_id) is None
+    
     def test_claim_unique_owner_enforced(self):
         """GC-3 V3: Unique claim ownership enforced (DUPLICATE_CLAIM_OWNER)"""
         claim = Claim.create("Shared claim", ClaimLabel.DERIVED)
@@ -229,10 +361,9 @@ class TestStructuralValidation:
         assert "step-001" in errors[0].message
         assert "step-002" in errors[0].message
     
-    def test_multiple_claims_single_step_valid(self):
+    def test_multiple_claims_single_step_valid(self, two_claims):
         """GC-3: Multiple claims in single step is valid"""
-        claim1 = Claim.create("First claim", ClaimLabel.DERIVED)
-        claim2 = Claim.create("Second claim", ClaimLabel.COMPUTED)
+        claim1, claim2 = two_claims
         step = DerivationStep(
             step_id="step-001",
             claim_ids=[claim1.claim_id, claim2.claim_id],
@@ -244,15 +375,10 @@ class TestStructuralValidation:
         assert is_valid
         assert len(errors) == 0
     
-    def test_step_dependencies_validated(self):
+    def test_step_dependencies_validated(self, single_claim_step):
         """GC-3: Step dependencies must reference existing steps (DANGLING_STEP_DEP)"""
-        claim = Claim.create("Test claim", ClaimLabel.DERIVED)
-        step = DerivationStep(
-            step_id="step-001",
-            claim_ids=[claim.claim_id],
-            statement="Test derivation step",
-            depends_on=["non-existent-step"],
-        )
+        claim, step = single_claim_step
+        step = dataclasses.replace(step, depends_on=["non-existent-step"])
         report = ScientificReport(claims=[claim], steps=[step])
         
         is_valid, errors = validate_report_structure(report)
@@ -261,10 +387,9 @@ class TestStructuralValidation:
         assert errors[0].category == "DANGLING_STEP_DEP"
         assert "non-existent-step" in errors[0].message
     
-    def test_valid_step_dependencies(self):
+    def test_valid_step_dependencies(self, two_claims):
         """GC-3: Valid step dependencies accepted"""
-        claim1 = Claim.create("First claim", ClaimLabel.DERIVED)
-        claim2 = Claim.create("Second claim", ClaimLabel.COMPUTED)
+        claim1, claim2 = two_claims
         step1 = DerivationStep(
             step_id="step-001",
             claim_ids=[claim1.claim_id],
@@ -283,265 +408,69 @@ class TestStructuralValidation:
         assert len(errors) == 0
 
 
-class TestGC3Fixtures:
-    """Test GC-3 fixtures for validation"""
-    
-    def test_gc3_valid_report_fixture(self):
-        """GC-3: Valid report fixture passes validation"""
-        fixture_path = Path(__file__).parent / "fixtures" / "gc3_valid_report.json"
-        with open(fixture_path, 'r') as f:
-            data = json.load(f)
-        
-        # Manually construct report from fixture
-        claims = [
-            Claim(
-                claim_id=c["claim_id"],
-                statement=c["statement"],
-                claim_label=ClaimLabel[c["claim_label"]],
-                evidence_ids=c.get("evidence_ids", []),
-            )
-            for c in data["claims"]
-        ]
-        
-        steps = [
-            DerivationStep(
-                    step_id=s["step_id"],
-                    claim_ids=s["claim_ids"],
-                    statement=s["statement"],
-                    step_status=StepStatus[s["step_status"]],
-                depends_on=s.get("depends_on", []),
-                status_reason=s.get("status_reason"),
-            )
-            for s in data["steps"]
-        ]
-        
-        report = ScientificReport(claims=claims, steps=steps)
-        is_valid, errors = validate_report_structure(report)
-        
-        assert is_valid
-        assert len(errors) == 0
-    
-    def test_gc3_invalid_dangling_claim_id_fixture(self):
-        """GC-3: Dangling claim_id fixture fails validation"""
-        fixture_path = Path(__file__).parent / "fixtures" / "gc3_invalid_dangling_claim_id.json"
-        with open(fixture_path, 'r') as f:
-            data = json.load(f)
-        
-        claims = [
-            Claim(
-                claim_id=c["claim_id"],
-                statement=c["statement"],
-                claim_label=ClaimLabel[c["claim_label"]],
-            )
-            for c in data["claims"]
-        ]
-        
-        steps = [
-            DerivationStep(
-                    step_id=s["step_id"],
-                    claim_ids=s["claim_ids"],
-                    statement=s["statement"],
-                    step_status=StepStatus[s["step_status"]],
-            )
-            for s in data["steps"]
-        ]
-        
-        report = ScientificReport(claims=claims, steps=steps)
-        is_valid, errors = validate_report_structure(report)
-        
-        assert not is_valid
-        assert any(e.category == "DANGLING_CLAIM_ID" for e in errors)
-    
-    def test_gc3_invalid_orphan_claim_fixture(self):
-        """GC-3: Orphan claim fixture fails validation"""
-        fixture_path = Path(__file__).parent / "fixtures" / "gc3_invalid_orphan_claim.json"
-        with open(fixture_path, 'r') as f:
-            data = json.load(f)
-        
-        claims = [
-            Claim(
-                claim_id=c["claim_id"],
-                statement=c["statement"],
-                claim_label=ClaimLabel[c["claim_label"]],
-            )
-            for c in data["claims"]
-        ]
-        
-        steps = [
-            DerivationStep(
-                    step_id=s["step_id"],
-                    claim_ids=s["claim_ids"],
-                    statement=s["statement"],
-                    step_status=StepStatus[s["step_status"]],
-            )
-            for s in data["steps"]
-        ]
-        
-        report = ScientificReport(claims=claims, steps=steps)
-        is_valid, errors = validate_report_structure(report)
-        
-        assert not is_valid
-        assert any(e.category == "ORPHAN_CLAIM" for e in errors)
-    
-    def test_gc3_invalid_duplicate_owner_fixture(self):
-        """GC-3: Duplicate claim owner fixture fails validation"""
-        fixture_path = Path(__file__).parent / "fixtures" / "gc3_invalid_duplicate_owner.json"
-        with open(fixture_path, 'r') as f:
-            data = json.load(f)
-        
-        claims = [
-            Claim(
-                claim_id=c["claim_id"],
-                statement=c["statement"],
-                claim_label=ClaimLabel[c["claim_label"]],
-            )
-            for c in data["claims"]
-        ]
-        
-        steps = [
-            DerivationStep(
-                    step_id=s["step_id"],
-                    claim_ids=s["claim_ids"],
-                    statement=s["statement"],
-                    step_status=StepStatus[s["step_status"]],
-            )
-            for s in data["steps"]
-        ]
-        
-        report = ScientificReport(claims=claims, steps=steps)
-        is_valid, errors = validate_report_structure(report)
-        
-        assert not is_valid
-        assert any(e.category == "DUPLICATE_CLAIM_OWNER" for e in errors)
-    
-    def test_gc3_invalid_empty_claim_ids_fixture(self):
-        """GC-3: Empty claim_ids fixture fails at construction"""
-        fixture_path = Path(__file__).parent / "fixtures" / "gc3_invalid_empty_claim_ids.json"
-        with open(fixture_path, 'r') as f:
-            data = json.load(f)
-        
-        with pytest.raises(ValueError, match="EMPTY_CLAIM_IDS"):
-            steps = [
-                DerivationStep(
-                    step_id=s["step_id"],
-                    claim_ids=s["claim_ids"],
-                    statement=s["statement"],
-                    step_status=StepStatus[s["step_status"]],
-                )
-                for s in data["steps"]
-            ]
-    
-    def test_gc3_invalid_claim_id_collision_fixture(self):
-        """GC-3: Claim ID collision fixture fails at construction"""
-        fixture_path = Path(__file__).parent / "fixtures" / "gc3_invalid_claim_id_collision.json"
-        with open(fixture_path, 'r') as f:
-            data = json.load(f)
-        
-        with pytest.raises(ValueError, match="CLAIM_ID_COLLISION"):
-            claims = [
-                Claim(
-                    claim_id=c["claim_id"],
-                    statement=c["statement"],
-                    claim_label=ClaimLabel[c["claim_label"]],
-                )
-                for c in data["claims"]
-            ]
-            report = ScientificReport(claims=claims, steps=[])
-    
-    def test_gc3_invalid_step_id_collision_fixture(self):
-        """GC-3: Step ID collision fixture fails at construction"""
-        fixture_path = Path(__file__).parent / "fixtures" / "gc3_invalid_step_id_collision.json"
-        with open(fixture_path, 'r') as f:
-            data = json.load(f)
-        
-        claims = [
-            Claim(
-                claim_id=c["claim_id"],
-                statement=c["statement"],
-                claim_label=ClaimLabel[c["claim_label"]],
-            )
-            for c in data["claims"]
-        ]
-        
-        steps = [
-            DerivationStep(
-                    step_id=s["step_id"],
-                    claim_ids=s["claim_ids"],
-                    statement=s["statement"],
-                    step_status=StepStatus[s["step_status"]],
-            )
-            for s in data["steps"]
-        ]
-        
-        with pytest.raises(ValueError, match="STEP_ID_COLLISION"):
-            report = ScientificReport(claims=claims, steps=steps)
+def _report_from_fixture(data: dict) -> ScientificReport:
+    """Build a ScientificReport from a GC-3 fixture (raises on construction errors)"""
+    claims = [
+        Claim(
+            claim_id=c["claim_id"],
+            statement=c["statement"],
+            claim_label=ClaimLabel[c["claim_label"]],
+            evidence_ids=list(c.get("evidence_ids", [])),
+        )
+        for c in data["claims"]
+    ]
     
-    def test_gc3_invalid_duplicate_in_step_fixture(self):
-        """GC-3: Duplicate claim in step fixture fails at construction"""
-        fixture_path = Path(__file__).parent / "fixtures" / "gc3_invalid_duplicate_in_step.json"
-        with open(fixture_path, 'r') as f:
-            data = json.load(f)
-        
-        with pytest.raises(ValueError, match="DUPLICATE_CLAIM_IN_STEP"):
-            steps = [
-                DerivationStep(
-                    step_id=s["step_id"],
-                    claim_ids=s["claim_ids"],
-                    statement=s["statement"],
-                    step_status=StepStatus[s["step_status"]],
-                )
-                for s in data["steps"]
-            ]
+    steps = [
+        DerivationStep(
+            step_id=s["step_id"],
+            claim_ids=list(s["claim_ids"]),
+            statement=s["statement"],
+            step_status=StepStatus[s["step_status"]],
+            depends_on=list(s.get("depends_on", [])),
+            status_reason=s.get("status_reason"),
+        )
+        for s in data["steps"]
+    ]
     
-    def test_gc3_invalid_dangling_step_dep_fixture(self):
-        """GC-3: Dangling step dependency fixture fails validation"""
-        fixture_path = Path(__file__).parent / "fixtures" / "gc3_invalid_dangling_step_dep.json"
-        with open(fixture_path, 'r') as f:
-            data = json.load(f)
-        
-        claims = [
-            Claim(
-                claim_id=c["claim_id"],
-                statement=c["statement"],
-                claim_label=ClaimLabel[c["claim_label"]],
-            )
-            for c in data["claims"]
-        ]
-        
-        steps = [
-            DerivationStep(
-                    step_id=s["step_id"],
-                    claim_ids=s["claim_ids"],
-                    statement=s["statement"],
-                    step_status=StepStatus[s["step_status"]],
-                depends_on=s.get("depends_on", []),
-            )
-            for s in data["steps"]
-        ]
-        
-        report = ScientificReport(claims=claims, steps=steps)
-        is_valid, errors = validate_report_structure(report)
-        
-        assert not is_valid
-        assert any(e.category == "DANGLING_STEP_DEP" for e in errors)
+    return ScientificReport(claims=claims, steps=steps)
+
+
+# (fixture file, expected error category or None, whether construction itself fails)
+GC3_FIXTURE_CASES = [
+    ("gc3_valid_report.json", None, False),
+    ("gc3_invalid_dangling_claim_id.json", "DANGLING_CLAIM_ID", False),
+    ("gc3_invalid_orphan_claim.json", "ORPHAN_CLAIM", False),
+    ("gc3_invalid_duplicate_owner.json", "DUPLICATE_CLAIM_OWNER", False),
+    ("gc3_invalid_dangling_step_dep.json", "DANGLING_STEP_DEP", False),
+    ("gc3_invalid_empty_claim_ids.json", "EMPTY_CLAIM_IDS", True),
+    ("gc3_invalid_claim_id_collision.json", "CLAIM_ID_COLLISION", True),
+    ("gc3_invalid_step_id_collision.json", "STEP_ID_COLLISION", True),
+    ("gc3_invalid_duplicate_in_step.json", "DUPLICATE_CLAIM_IN_STEP", True),
+    ("gc3_invalid_indeterminate_no_reason.json", "INDETERMINATE_MISSING_REASON", True),
+]
+
+
+class TestGC3Fixtures:
+    """Test GC-3 fixtures for validation"""
     
-    def test_gc3_invalid_indeterminate_no_reason_fixture(self):
-        """GC-3: INDETERMINATE without reason fixture fails at construction"""
-        fixture_path = Path(__file__).parent / "fixtures" / "gc3_invalid_indeterminate_no_reason.json"
-        with open(fixture_path, 'r') as f:
-            data = json.load(f)
-        
-        with pytest.raises(ValueError, match="INDETERMINATE_MISSING_REASON"):
-            steps = [
-                DerivationStep(
-                    step_id=s["step_id"],
-                    claim_ids=s["claim_ids"],
-                    statement=s["statement"],
-                    step_status=StepStatus[s["step_status"]],
-                    status_reason=s.get("status_reason"),
-                )
-                for s in data["steps"]
-            ]
+    @pytest.mark.parametrize("fixture_name, category, construction_error", GC3_FIXTURE_CASES)
+    def test_gc3_fixture(self, fixture_name, category, construction_error):
+        """GC-3: Each fixture passes, fails validation, or fails at construction as labelled"""
+        data = load_fixture(fixture_name)
+        
+        if construction_error:
+            with pytest.raises(ValueError, match=category):
+                _report_from_fixture(data)
+            return
+        
+        is_valid, errors = validate_report_structure(_report_from_fixture(data))
+        
+        if category is None:
+            assert is_valid
+            assert len(errors) == 0
+        else:
+            assert not is_valid
+            assert any(e.category == category for e in errors)
 
 
 class TestValidationErrorReporting:
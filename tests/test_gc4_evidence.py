@@ -116,6 +116,13 @@ class TestWireBoundaryParsing:
         with pytest.raises(ValueError, match="Invalid evidence_id: None"):
             parse_evidence_id(None)
     
+    def test_parse_evidence_id_error_message_is_bounded(self):
+        """GC-4: Rejecting a huge wire value does not echo all of it"""
+        with pytest.raises(ValueError, match="leading/trailing whitespace") as exc_info:
+            parse_evidence_id(" " + "evidence-001" * 10_000)
+        assert len(str(exc_info.value)) < 200
+        assert "' evidence-001evidence-001" in str(exc_info.value)
+    
     def test_parse_evidence_id_rejects_non_string(self):
         """GC-4: Non-string types rejected"""
         with pytest.raises(TypeError, match="expected string, got int"):
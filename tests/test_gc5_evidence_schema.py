@@ -329,6 +329,23 @@ class TestWireBoundaryParsers:
         with pytest.raises(ValueError, match="non-ASCII characters"):
             parse_evidence_id("evidence-Ε01")  # Greek Epsilon
     
+    def test_parse_evidence_id_error_message_is_bounded(self):
+        """GC-5: rejecting a huge wire value does not echo all of it"""
+        with pytest.raises(ValueError, match="internal whitespace") as exc_info:
+            parse_evidence_id("evidence 001" * 10_000)
+        assert len(str(exc_info.value)) < 200
+        assert "'evidence 001evidence 001" in str(exc_info.value)
+    
+    def test_parse_evidence_id_error_message_uses_plain_repr(self):
+        """GC-5: short wire values are echoed with repr(), key order intact"""
+        with pytest.raises(TypeError) as exc_info:
+            parse_evidence_id({"b": 1, "a": 2})
+        assert "{'b': 1, 'a': 2}" in str(exc_info.value)
+        
+        with pytest.raises(TypeError) as exc_info:
+            parse_evidence_id(list(range(10)))
+        assert repr(list(range(10))) in str(exc_info.value)
+    
     def test_parse_evidence_type_valid(self):
         """GC-5: parse_evidence_type accepts valid types"""
         assert parse_evidence_type("derivation") == EvidenceType.DERIVATION
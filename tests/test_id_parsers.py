@@ -22,6 +22,12 @@ class TestParseClaimId:
         assert parse_claim_id("claim_abc_123") == "claim_abc_123"
         assert parse_claim_id("CLAIM-XYZ") == "CLAIM-XYZ"
     
+    def test_parse_claim_id_interns_result(self):
+        """GC-6.1: Equal IDs parsed from separate wire strings share one object"""
+        first = parse_claim_id("".join(["claim-", "dup"]))
+        second = parse_claim_id("".join(["claim-", "dup"]))
+        assert first is second
+    
     def test_parse_claim_id_rejects_none(self):
         """GC-6.1: Reject None"""
         with pytest.raises(ValueError, match="Invalid claim_id: None"):
@@ -39,6 +39,17 @@ class TestClaimLogger:
         assert Path(log_dir, "claim_extraction.jsonl").exists()
         assert input_hash == logger.compute_input_hash(text)
     
+    def test_log_extraction_uses_precomputed_hash(self):
+        log_dir = tempfile.mkdtemp()
+        logger = ClaimLogger(log_dir=log_dir)
+        
+        text = "The energy is E = mc^2."
+        input_hash = logger.compute_input_hash(text)
+        
+        assert logger.log_extraction(text, [], run_id="run_1", input_hash=input_hash) == input_hash
+        with open(Path(log_dir, "claim_extraction.jsonl"), 'r') as f:
+            assert json.loads(f.readline())["input_hash"] == input_hash
+    
     def test_log_extraction_content(self):
         log_dir = tempfile.mkdtemp()
         logger = ClaimLogger(log_dir=log_dir)
@@ -106,3 +117,40 @@ class TestClaimLogger:
         with open(Path(log_dir, "claim_extraction.jsonl"), 'r') as f:
             lines = f.readlines()
             assert len(lines) == 2
+    
+    def test_log_timestamp_is_utc_iso8601(self):
+        from datetime import datetime, timedelta, timezone
+        
+        log_dir = tempfile.mkdtemp()
+        logger = ClaimLogger(log_dir=log_dir)
+        
+        before = datetime.now(timezone.utc)
+        logger.log_extraction("First text.", [], run_id="run_ts")
+        after = datetime.now(timezone.utc)
+        
+        with open(Path(log_dir, "claim_extraction.jsonl"), 'r') as f:
+            entry = json.loads(f.readline())
+        
+        timestamp = datetime.fromisoformat(entry["timestamp"])
+        assert timestamp.utcoffset() == timedelta(0)
+        assert before - timedelta(seconds=1) <= timestamp <= after + timedelta(seconds=1)
+    
+    def test_close_then_log_reopens_file(self):
+        log_dir = tempfile.mkdtemp()
+        logger = ClaimLogger(log_dir=log_dir)
+        
+        logger.log_extraction("First text.", [], run_id="run_1")
+        logger.close()
+        logger.log_extraction("Second text.", [], run_id="run_2")
+        logger.close()
+        
+        with open(Path(log_dir, "claim_extraction.jsonl"), 'r') as f:
+            run_ids = [json.loads(line)["run_id"] for line in f]
+        assert run_ids == ["run_1", "run_2"]
+    
+    def test_encoded_entry_bytes_match_stdlib_fallback(self):
+        from src.core.logging import _dumps, _json_dumps
+        entry = {"run_id": "r", "statement": "Énergie ≈ mc²", "claims": [{"n": 1, "ok": True}]}
+        
+        assert _dumps(entry) == _json_dumps(entry)
+        assert _dumps({1: "non-str key"}) == _json_dumps({1: "non-str key"})